@@ -0,0 +1,68 @@
+"""
+Benchmark of trade event dispatch latency when the event queue
+is saturated with tick events.
+
+Compare the default FIFO event engine with the priority-aware one.
+"""
+
+from time import perf_counter, sleep
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.event import EVENT_TICK, EVENT_TRADE, EVENT_ORDER
+
+
+TICK_COUNT = 20_000
+TRADE_COUNT = 20
+TICK_COST = 0.00002
+
+
+def run_benchmark(priorities: dict[str, int] | None) -> list[float]:
+    """
+    Put trade events behind a large backlog of ticks and measure
+    the time from put to dispatch of each trade event.
+    """
+    event_engine: EventEngine = EventEngine(priorities=priorities)
+
+    latencies: list[float] = []
+
+    def process_tick_event(event: Event) -> None:
+        # Simulate time cost of tick processing
+        end: float = perf_counter() + TICK_COST
+        while perf_counter() < end:
+            pass
+
+    def process_trade_event(event: Event) -> None:
+        latencies.append(perf_counter() - event.data)
+
+    event_engine.register(EVENT_TICK, process_tick_event)
+    event_engine.register(EVENT_TRADE, process_trade_event)
+    event_engine.start()
+
+    step: int = TICK_COUNT // TRADE_COUNT
+    for i in range(TICK_COUNT):
+        event_engine.put(Event(EVENT_TICK, i))
+
+        if not i % step:
+            event_engine.put(Event(EVENT_TRADE, perf_counter()))
+
+    while len(latencies) < TRADE_COUNT:
+        sleep(0.01)
+
+    event_engine.stop()
+    return latencies
+
+
+def print_result(name: str, latencies: list[float]) -> None:
+    """"""
+    latencies.sort()
+    mean: float = sum(latencies) / len(latencies)
+    print(
+        f"{name:<10} mean {mean * 1000:10.3f} ms"
+        f"  p50 {latencies[len(latencies) // 2] * 1000:10.3f} ms"
+        f"  max {latencies[-1] * 1000:10.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    print_result("fifo", run_benchmark(None))
+    print_result("priority", run_benchmark({EVENT_TRADE: 0, EVENT_ORDER: 0, EVENT_TICK: 20}))
@@ -0,0 +1,73 @@
+"""
+Benchmark of put/get throughput of event queue backends.
+"""
+
+from threading import Thread
+from time import perf_counter, sleep
+
+from vnpy.event import Event, EventEngine
+from vnpy.event.engine import EventQueue, DequeEventQueue, LaneQueue
+
+
+EVENT_COUNT = 1_000_000
+
+
+def run_queue_benchmark(queue: LaneQueue) -> float:
+    """
+    Put events from one producer thread and get them from one
+    consumer thread, return events per second.
+    """
+    events: list[Event] = [Event("eTick.", i) for i in range(EVENT_COUNT)]
+
+    def consume() -> None:
+        for _ in range(EVENT_COUNT):
+            queue.get(block=True, timeout=1)
+
+    consumer: Thread = Thread(target=consume)
+    consumer.start()
+
+    start: float = perf_counter()
+
+    for event in events:
+        queue.put(event)
+
+    consumer.join()
+    return EVENT_COUNT / (perf_counter() - start)
+
+
+def run_engine_benchmark(backend: str) -> float:
+    """
+    Put events into event engine with one handler, return events
+    processed per second.
+    """
+    event_engine: EventEngine = EventEngine(backend=backend)
+
+    count: list[int] = [0]
+
+    def process_event(event: Event) -> None:
+        count[0] += 1
+
+    event_engine.register("eTick.", process_event)
+    event_engine.start()
+
+    events: list[Event] = [Event("eTick.", i) for i in range(EVENT_COUNT)]
+
+    start: float = perf_counter()
+
+    for event in events:
+        event_engine.put(event)
+
+    while count[0] < EVENT_COUNT:
+        sleep(0.001)
+
+    result: float = EVENT_COUNT / (perf_counter() - start)
+
+    event_engine.stop()
+    return result
+
+
+if __name__ == "__main__":
+    print(f"queue  backend: {run_queue_benchmark(EventQueue()):12,.0f} events/s (queue only)")
+    print(f"deque  backend: {run_queue_benchmark(DequeEventQueue()):12,.0f} events/s (queue only)")
+    print(f"queue  backend: {run_engine_benchmark('queue'):12,.0f} events/s (event engine)")
+    print(f"deque  backend: {run_engine_benchmark('deque'):12,.0f} events/s (event engine)")
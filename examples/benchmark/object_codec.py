@@ -0,0 +1,94 @@
+"""
+Benchmark of encoding and decoding data objects with ObjectCodec
+and pickle, and the size of encoded data.
+
+Results are scaled to one million objects.
+"""
+
+import pickle
+from collections.abc import Callable
+from datetime import datetime
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+from vnpy.trader.codec import ObjectCodec
+from vnpy.trader.constant import Direction, Exchange, Offset, Status
+from vnpy.trader.object import TickData, OrderData
+
+
+OBJECT_COUNT = 100_000
+SCALE = 1_000_000 / OBJECT_COUNT
+
+
+def create_tick() -> TickData:
+    """"""
+    tick: TickData = TickData(
+        gateway_name="CTP",
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        datetime=datetime.now(ZoneInfo("Asia/Shanghai")),
+        name="螺纹钢2501",
+        volume=123456,
+        turnover=4.3e9,
+        open_interest=1.2e6,
+        last_price=3500.0,
+        last_volume=10,
+        limit_up=3800,
+        limit_down=3200,
+        bid_price_1=3499.0,
+        ask_price_1=3501.0,
+        bid_volume_1=10,
+        ask_volume_1=20,
+        localtime=datetime.now()
+    )
+    return tick
+
+
+def create_order() -> OrderData:
+    """"""
+    order: OrderData = OrderData(
+        gateway_name="CTP",
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        orderid="1_-123456_1",
+        direction=Direction.LONG,
+        offset=Offset.OPEN,
+        price=3500.0,
+        volume=10,
+        traded=5,
+        status=Status.PARTTRADED,
+        datetime=datetime.now(ZoneInfo("Asia/Shanghai")),
+        reference="CtaStrategy"
+    )
+    return order
+
+
+def run_benchmark(name: str, obj: object, encode: Callable, decode: Callable) -> None:
+    """
+    Measure time of encoding and decoding, and size of encoded data.
+    """
+    start: float = perf_counter()
+    for _ in range(OBJECT_COUNT):
+        data: bytes = encode(obj)
+    encode_cost: float = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(OBJECT_COUNT):
+        decode(data)
+    decode_cost: float = perf_counter() - start
+
+    print(
+        f"{name:<20}"
+        f" encode {encode_cost * SCALE:7.3f} s"
+        f"  decode {decode_cost * SCALE:7.3f} s"
+        f"  size {len(data):5d} bytes"
+    )
+
+
+if __name__ == "__main__":
+    codec: ObjectCodec = ObjectCodec()
+
+    for obj in [create_tick(), create_order()]:
+        type_name: str = type(obj).__name__
+        run_benchmark(f"{type_name} pickle", obj, pickle.dumps, pickle.loads)
+        run_benchmark(f"{type_name} codec", obj, codec.encode, codec.decode)
@@ -0,0 +1,100 @@
+"""
+Benchmark of memory footprint and construction time of tick data
+objects with __dict__ (TickData) and __slots__ (SlotTickData).
+
+Results are scaled to one million objects.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from time import perf_counter
+
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData, SlotTickData, BarData, SlotBarData
+
+
+OBJECT_COUNT = 200_000
+SCALE = 1_000_000 / OBJECT_COUNT
+
+
+def create_ticks(tick_class: type) -> list:
+    """"""
+    dt: datetime = datetime.now()
+
+    return [
+        tick_class(
+            gateway_name="CTP",
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=dt,
+            last_price=3500.0 + i,
+            volume=i,
+            bid_price_1=3499.0,
+            ask_price_1=3501.0,
+            bid_volume_1=10,
+            ask_volume_1=20,
+        )
+        for i in range(OBJECT_COUNT)
+    ]
+
+
+def create_bars(bar_class: type) -> list:
+    """"""
+    dt: datetime = datetime.now()
+
+    return [
+        bar_class(
+            gateway_name="DB",
+            symbol="rb2501",
+            exchange=Exchange.SHFE,
+            datetime=dt,
+            open_price=3500.0 + i,
+            high_price=3510.0,
+            low_price=3490.0,
+            close_price=3505.0,
+            volume=i,
+        )
+        for i in range(OBJECT_COUNT)
+    ]
+
+
+def run_benchmark(name: str, func: Callable, data_class: type) -> None:
+    """
+    Measure time, number of allocated blocks and bytes of creating objects.
+    """
+    gc.collect()
+    gc.disable()
+
+    start: float = perf_counter()
+    func(data_class)
+    cost: float = perf_counter() - start
+
+    gc.enable()
+    gc.collect()
+
+    tracemalloc.start()
+    objects: list = func(data_class)
+    snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats: list[tracemalloc.Statistic] = snapshot.statistics("filename")
+    count: int = sum(stat.count for stat in stats)
+    size: int = sum(stat.size for stat in stats)
+
+    print(
+        f"{name:<14}"
+        f" time {cost * SCALE:8.3f} s"
+        f"  blocks {count * SCALE / 1_000_000:8.2f} M"
+        f"  memory {size * SCALE / 1024 / 1024:10.1f} MB"
+    )
+
+    del objects
+
+
+if __name__ == "__main__":
+    run_benchmark("TickData", create_ticks, TickData)
+    run_benchmark("SlotTickData", create_ticks, SlotTickData)
+    run_benchmark("BarData", create_bars, BarData)
+    run_benchmark("SlotBarData", create_bars, SlotBarData)
@@ -0,0 +1,132 @@
+"""
+Benchmark of publishing tick data by RpcServer without batching,
+with batching, and with batching and conflation by vt_symbol.
+
+Ticks of many symbols are published in bursts at fixed rate, which
+is similar to market data fan-out. CPU time is of the whole process
+including both server and client.
+"""
+
+from datetime import datetime
+from threading import Event
+from time import perf_counter, process_time, sleep
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+
+
+SYMBOL_COUNT = 100
+BURST_COUNT = 400
+BURST_INTERVAL = 0.005
+BATCH_INTERVAL = 0.005
+
+REP_PORT = 12914
+PUB_PORT = 14102
+
+
+def create_ticks() -> list[TickData]:
+    """"""
+    ticks: list[TickData] = []
+
+    for i in range(SYMBOL_COUNT):
+        tick: TickData = TickData(
+            gateway_name="CTP",
+            symbol=f"rb{i}",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(ZoneInfo("Asia/Shanghai")),
+            volume=123456,
+            last_price=3500.0,
+            bid_price_1=3499.0,
+            ask_price_1=3501.0,
+            bid_volume_1=10,
+            ask_volume_1=20,
+        )
+        ticks.append(tick)
+
+    return ticks
+
+
+class BenchmarkClient(RpcClient):
+    """
+    Client counting messages and data received.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.message_count: int = 0
+        self.data_count: int = 0
+        self.event: Event = Event()
+
+    def loads(self, data: bytes) -> Any:
+        """"""
+        self.message_count += 1
+        return super().loads(data)
+
+    def callback(self, topic: str, data: Any) -> None:
+        """"""
+        if topic == "end":
+            self.event.set()
+        else:
+            self.data_count += 1
+
+
+def run_benchmark(name: str, batch_interval: float, conflate: bool, offset: int) -> None:
+    """
+    Publish bursts of ticks and measure cost.
+    """
+    rep_address: str = f"tcp://127.0.0.1:{REP_PORT + offset}"
+    pub_address: str = f"tcp://127.0.0.1:{PUB_PORT + offset}"
+
+    server: RpcServer = RpcServer(batch_interval=batch_interval)
+    server.start(rep_address, pub_address)
+
+    client: BenchmarkClient = BenchmarkClient()
+    client.subscribe_topic("")
+    client.start(rep_address, pub_address)
+    sleep(1)
+
+    ticks: list[TickData] = create_ticks()
+    publish_cost: float = 0
+    cpu_start: float = process_time()
+
+    for _ in range(BURST_COUNT):
+        start: float = perf_counter()
+
+        for tick in ticks:
+            if conflate:
+                server.publish("tick", tick, tick.vt_symbol)
+            else:
+                server.publish("tick", tick)
+
+        publish_cost += perf_counter() - start
+        sleep(BURST_INTERVAL)
+
+    server.publish("end", None)
+    client.event.wait()
+    cpu_cost: float = process_time() - cpu_start
+
+    print(
+        f"{name:<20}"
+        f" publish {publish_cost:6.3f} s"
+        f"  cpu {cpu_cost:6.3f} s"
+        f"  messages {client.message_count:6d}"
+        f"  ticks {client.data_count:6d}"
+    )
+
+    client.stop()
+    server.publish("end", None)
+    client.join()
+
+    server.stop()
+    server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark("no batch", 0, False, 0)
+    run_benchmark("batch", BATCH_INTERVAL, False, 1)
+    run_benchmark("batch and conflate", BATCH_INTERVAL, True, 2)
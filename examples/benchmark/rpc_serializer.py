@@ -0,0 +1,130 @@
+"""
+Benchmark of RPC call round-trip and publish throughput with each
+serializer of vnpy.rpc.
+
+Publishing is done in chunks, and next chunk is published after the
+previous one is received by client, so that no data is dropped.
+"""
+
+from datetime import datetime
+from threading import Event
+from time import perf_counter, sleep
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+
+
+CALL_COUNT = 5_000
+PUBLISH_COUNT = 50_000
+CHUNK_SIZE = 500
+
+REP_PORT = 12914
+PUB_PORT = 14102
+
+
+def create_tick() -> TickData:
+    """"""
+    tick: TickData = TickData(
+        gateway_name="CTP",
+        symbol="rb2501",
+        exchange=Exchange.SHFE,
+        datetime=datetime.now(ZoneInfo("Asia/Shanghai")),
+        name="螺纹钢2501",
+        volume=123456,
+        turnover=4.3e9,
+        open_interest=1.2e6,
+        last_price=3500.0,
+        last_volume=10,
+        limit_up=3800,
+        limit_down=3200,
+        bid_price_1=3499.0,
+        ask_price_1=3501.0,
+        bid_volume_1=10,
+        ask_volume_1=20,
+        localtime=datetime.now()
+    )
+    return tick
+
+
+def echo(data: Any) -> Any:
+    """"""
+    return data
+
+
+class BenchmarkClient(RpcClient):
+    """
+    Client counting data received.
+    """
+
+    def __init__(self, serializer: str) -> None:
+        """"""
+        super().__init__(serializers=[serializer])
+
+        self.count: int = 0
+        self.target: int = 0
+        self.event: Event = Event()
+
+    def callback(self, topic: str, data: Any) -> None:
+        """"""
+        self.count += 1
+
+        if self.count >= self.target:
+            self.event.set()
+
+
+def run_benchmark(serializer: str, offset: int) -> None:
+    """
+    Measure call round-trip and publish throughput with serializer,
+    each run uses ports of different offset.
+    """
+    rep_address: str = f"tcp://127.0.0.1:{REP_PORT + offset}"
+    pub_address: str = f"tcp://127.0.0.1:{PUB_PORT + offset}"
+
+    server: RpcServer = RpcServer(serializers=[serializer], publish_serializer=serializer)
+    server.register(echo)
+    server.start(rep_address, pub_address)
+
+    client: BenchmarkClient = BenchmarkClient(serializer)
+    client.subscribe_topic("")
+    client.start(rep_address, pub_address)
+    sleep(1)
+
+    tick: TickData = create_tick()
+
+    start: float = perf_counter()
+    for _ in range(CALL_COUNT):
+        client.echo(tick)
+    call_cost: float = perf_counter() - start
+
+    start = perf_counter()
+    for i in range(0, PUBLISH_COUNT, CHUNK_SIZE):
+        client.target = i + CHUNK_SIZE
+        client.event.clear()
+
+        for _ in range(CHUNK_SIZE):
+            server.publish("tick", tick)
+
+        client.event.wait()
+    publish_cost: float = perf_counter() - start
+
+    print(
+        f"{serializer:<10}"
+        f" call {call_cost / CALL_COUNT * 1_000_000:7.1f} us"
+        f"  publish {PUBLISH_COUNT / publish_cost:9.0f} msg/s"
+    )
+
+    # Publish once more to wake up client thread waiting for data
+    client.stop()
+    server.publish("tick", tick)
+    client.join()
+
+    server.stop()
+    server.join()
+
+
+if __name__ == "__main__":
+    for offset, serializer in enumerate(["pickle", "msgpack", "object"]):
+        run_benchmark(serializer, offset)
@@ -0,0 +1,132 @@
+"""
+Benchmark of RpcClient subscribing tick data of one symbol, while
+ticks of many symbols are published by RpcServer.
+
+With topic frame, messages of other symbols are filtered inside zmq.
+Without it (forced by a subscriber of old version connected), all
+messages are received and loaded by client before filtered by topic.
+"""
+
+from datetime import datetime
+from threading import Event
+from time import perf_counter, sleep
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import zmq
+
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+
+
+SYMBOL_COUNT = 100
+ROUND_COUNT = 200
+
+REP_PORT = 12914
+PUB_PORT = 14102
+
+
+def create_ticks() -> list[TickData]:
+    """"""
+    ticks: list[TickData] = []
+
+    for i in range(SYMBOL_COUNT):
+        tick: TickData = TickData(
+            gateway_name="CTP",
+            symbol=f"rb{i}",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(ZoneInfo("Asia/Shanghai")),
+            last_price=3500.0
+        )
+        ticks.append(tick)
+
+    return ticks
+
+
+class BenchmarkClient(RpcClient):
+    """
+    Client counting messages loaded and data received.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.message_count: int = 0
+        self.data_count: int = 0
+        self.event: Event = Event()
+
+    def loads(self, data: bytes) -> Any:
+        """"""
+        self.message_count += 1
+        return super().loads(data)
+
+    def callback(self, topic: str, data: Any) -> None:
+        """"""
+        if topic == "end":
+            self.event.set()
+        else:
+            self.data_count += 1
+
+
+def run_benchmark(name: str, legacy: bool, offset: int) -> None:
+    """
+    Publish ticks of all symbols and measure time until received.
+    """
+    rep_address: str = f"tcp://127.0.0.1:{REP_PORT + offset}"
+    pub_address: str = f"tcp://127.0.0.1:{PUB_PORT + offset}"
+
+    server: RpcServer = RpcServer()
+    server.start(rep_address, pub_address)
+
+    client: BenchmarkClient = BenchmarkClient()
+    client.subscribe_topic("tick.rb0.SHFE")
+    client.subscribe_topic("end")
+    client.start(rep_address, pub_address)
+
+    # Subscriber of old version, which receives all messages
+    context: zmq.Context = zmq.Context()
+    socket: zmq.Socket = context.socket(zmq.SUB)
+    socket.setsockopt(zmq.RCVHWM, 0)
+
+    if legacy:
+        socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        socket.connect(pub_address)
+
+    sleep(1)
+
+    ticks: list[TickData] = create_ticks()
+    start: float = perf_counter()
+
+    for _ in range(ROUND_COUNT):
+        for tick in ticks:
+            server.publish(f"tick.{tick.vt_symbol}", tick)
+
+        sleep(0.001)
+
+    server.publish("end", None)
+    client.event.wait()
+    cost: float = perf_counter() - start
+
+    print(
+        f"{name:<20}"
+        f" time {cost:6.3f} s"
+        f"  messages loaded {client.message_count:6d}"
+        f"  ticks {client.data_count:6d}"
+    )
+
+    socket.close()
+    context.term()
+
+    client.stop()
+    server.publish("end", None)
+    client.join()
+
+    server.stop()
+    server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark("topic frame", False, 0)
+    run_benchmark("single frame", True, 1)
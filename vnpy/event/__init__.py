@@ -1,8 +1,22 @@
-from .engine import Event, EventEngine, EVENT_TIMER
+from .engine import (
+    Event,
+    EventEngine,
+    HandlerAlert,
+    EVENT_TIMER,
+    EVENT_METRICS,
+    EVENT_HANDLER_ERROR,
+    EVENT_HANDLER_SLOW
+)
+from .async_engine import AsyncEventEngine
 
 
 __all__ = [
     "Event",
     "EventEngine",
+    "AsyncEventEngine",
+    "HandlerAlert",
     "EVENT_TIMER",
+    "EVENT_METRICS",
+    "EVENT_HANDLER_ERROR",
+    "EVENT_HANDLER_SLOW",
 ]
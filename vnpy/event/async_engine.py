@@ -0,0 +1,304 @@
+"""
+Asyncio based event engine of VeighNa framework.
+"""
+
+import asyncio
+import sys
+import traceback
+from asyncio import AbstractEventLoop, Queue, Task, TimerHandle
+from collections import defaultdict
+from inspect import isawaitable
+from threading import Thread, get_ident
+from typing import Any
+from collections.abc import Callable
+
+from .engine import (
+    Event,
+    HandlerAlert,
+    EVENT_TIMER,
+    EVENT_HANDLER_ERROR,
+    ALERT_TYPES
+)
+from .metrics import get_handler_name
+
+
+class AsyncEventEngine:
+    """
+    Event engine with the same interface as EventEngine, but events
+    are distributed to handlers by a coroutine running on asyncio
+    event loop.
+
+    Handler can be either normal function or coroutine function, and
+    coroutine handlers are awaited one by one to keep event order.
+    Method put is thread-safe, so it can be called from both loop
+    and other threads (e.g. callbacks of gateway API).
+
+    If no loop is given, a new loop is created and run in a separate
+    thread after start, otherwise the given loop is used, which
+    should be run by its owner.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1,
+        loop: AbstractEventLoop | None = None
+    ) -> None:
+        """
+        Timer event is generated every 1 second by default, if
+        interval not specified. Fractional interval is supported.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid timer interval: {interval}")
+
+        self._interval: float = interval
+        self._loop: AbstractEventLoop | None = loop
+        self._thread: Thread | None = None
+        self._loop_ident: int | None = None
+
+        self._active: bool = False
+        self._queue: Queue = Queue()
+        self._task: Task | None = None
+
+        self._handlers: defaultdict = defaultdict(list)
+        self._general_handlers: list = []
+
+        self._timer_intervals: dict[str, float] = {EVENT_TIMER: interval}
+        self._timer_handles: dict[str, TimerHandle] = {}
+
+    def _run_loop(self) -> None:
+        """
+        Run the event loop owned by event engine.
+        """
+        if not self._loop:
+            return
+
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _run(self) -> None:
+        """
+        Get event from queue and then process it.
+        """
+        while self._active:
+            event: Event = await self._queue.get()
+            await self._process(event)
+
+    async def _process(self, event: Event) -> None:
+        """
+        First distribute event to those handlers registered listening
+        to this type.
+
+        Then distribute event to those general handlers which listens
+        to all types.
+        """
+        if event.type in self._handlers:
+            for handler in self._handlers[event.type]:
+                await self._call(handler, event)
+
+        if self._general_handlers:
+            for handler in self._general_handlers:
+                await self._call(handler, event)
+
+    async def _call(self, handler: Callable, event: Event) -> None:
+        """
+        Call handler and await the result if it is awaitable, exception
+        raised is captured and reported.
+        """
+        try:
+            result: Any = handler(event)
+
+            if isawaitable(result):
+                await result
+        except Exception:
+            alert: HandlerAlert = HandlerAlert(get_handler_name(handler), event.type, traceback.format_exc())
+
+            if EVENT_HANDLER_ERROR not in self._handlers or event.type in ALERT_TYPES:
+                print(alert, file=sys.stderr)
+            else:
+                self._queue.put_nowait(Event(EVENT_HANDLER_ERROR, alert))
+
+    def _call_in_loop(self, func: Callable, *args: Any) -> None:
+        """
+        Call function in loop thread.
+        """
+        if not self._loop or get_ident() == self._loop_ident:
+            func(*args)
+        else:
+            self._loop.call_soon_threadsafe(func, *args)
+
+    def _start_dispatch(self) -> None:
+        """
+        Start dispatch task and timers in loop thread.
+        """
+        if not self._loop:
+            return
+
+        self._loop_ident = get_ident()
+        self._task = self._loop.create_task(self._run())
+
+        for type in self._timer_intervals.keys():
+            self._start_timer(type)
+
+    def _stop_dispatch(self) -> None:
+        """
+        Stop dispatch task and timers in loop thread.
+        """
+        for handle in self._timer_handles.values():
+            handle.cancel()
+        self._timer_handles.clear()
+
+        task: Task | None = self._task
+        self._task = None
+
+        # Stop owned loop after dispatch task is cancelled
+        if self._thread:
+            if task:
+                task.add_done_callback(self._stop_loop)
+            else:
+                self._stop_loop()
+
+        if task:
+            task.cancel()
+
+    def _stop_loop(self, task: Task | None = None) -> None:
+        """
+        Stop the event loop owned by event engine.
+        """
+        if self._loop:
+            self._loop.stop()
+
+    def _start_timer(self, type: str) -> None:
+        """
+        Schedule first call of timer by loop.
+        """
+        if not self._loop or not self._active or type in self._timer_handles:
+            return
+
+        deadline: float = self._loop.time() + self._timer_intervals[type]
+        self._timer_handles[type] = self._loop.call_at(deadline, self._on_timer, type, deadline)
+
+    def _on_timer(self, type: str, deadline: float) -> None:
+        """
+        Put timer event and schedule next call by deadline, so that
+        timer does not drift.
+        """
+        self._timer_handles.pop(type, None)
+
+        interval: float | None = self._timer_intervals.get(type, None)
+        if not self._loop or not self._active or not interval:
+            return
+
+        self._queue.put_nowait(Event(type))
+
+        missed: float = (self._loop.time() - deadline) // interval
+        deadline += (missed + 1) * interval
+        self._timer_handles[type] = self._loop.call_at(deadline, self._on_timer, type, deadline)
+
+    def _stop_timer(self, type: str) -> None:
+        """
+        Cancel next call of timer.
+        """
+        handle: TimerHandle | None = self._timer_handles.pop(type, None)
+        if handle:
+            handle.cancel()
+
+    def start(self) -> None:
+        """
+        Start event engine to process events and generate timer events.
+        """
+        if self._active:
+            return
+        self._active = True
+
+        if not self._loop:
+            self._loop = asyncio.new_event_loop()
+            self._thread = Thread(target=self._run_loop, name="AsyncEventEngine")
+            self._thread.start()
+
+        self._loop.call_soon_threadsafe(self._start_dispatch)
+
+    def stop(self) -> None:
+        """
+        Stop event engine.
+        """
+        if not self._active:
+            return
+        self._active = False
+
+        self._call_in_loop(self._stop_dispatch)
+
+        if self._thread and get_ident() != self._loop_ident:
+            self._thread.join()
+            self._thread = None
+            self._loop = None
+
+    def put(self, event: Event) -> None:
+        """
+        Put an event object into event queue.
+        """
+        if self._active:
+            self._call_in_loop(self._queue.put_nowait, event)
+        else:
+            self._queue.put_nowait(event)
+
+    def add_timer(self, name: str, interval: float) -> str:
+        """
+        Add a named timer which generates timer event by every interval
+        seconds, and return the event type of the timer for register.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid timer interval: {interval}")
+
+        type: str = f"{EVENT_TIMER}.{name}"
+
+        self._timer_intervals[type] = interval
+        self._call_in_loop(self._stop_timer, type)
+        self._call_in_loop(self._start_timer, type)
+
+        return type
+
+    def remove_timer(self, name: str) -> None:
+        """
+        Remove an existing named timer.
+        """
+        type: str = f"{EVENT_TIMER}.{name}"
+
+        if self._timer_intervals.pop(type, None):
+            self._call_in_loop(self._stop_timer, type)
+
+    def register(self, type: str, handler: Callable) -> None:
+        """
+        Register a new handler function for a specific event type. Every
+        function can only be registered once for each event type.
+        """
+        handler_list: list = self._handlers[type]
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+    def unregister(self, type: str, handler: Callable) -> None:
+        """
+        Unregister an existing handler function from event engine.
+        """
+        handler_list: list = self._handlers[type]
+
+        if handler in handler_list:
+            handler_list.remove(handler)
+
+        if not handler_list:
+            self._handlers.pop(type)
+
+    def register_general(self, handler: Callable) -> None:
+        """
+        Register a new handler function for all event types. Every
+        function can only be registered once for each event type.
+        """
+        if handler not in self._general_handlers:
+            self._general_handlers.append(handler)
+
+    def unregister_general(self, handler: Callable) -> None:
+        """
+        Unregister an existing general handler function.
+        """
+        if handler in self._general_handlers:
+            self._general_handlers.remove(handler)
@@ -2,15 +2,33 @@
 Event-driven framework of VeighNa framework.
 """
 
-from collections import defaultdict
+import sys
+import traceback
+from collections import defaultdict, deque
 from collections.abc import Callable
+from functools import partial
+from heapq import heappush, heappop
+from itertools import count
 from queue import Empty, Queue
-from threading import Thread
-from time import sleep
+from threading import Condition, Event as ThreadEvent, Thread
+from time import monotonic, perf_counter
+from types import FrameType
 from typing import Any
 
+from .metrics import EventMetrics, LaneMetrics, SAMPLE_INTERVAL, get_handler_name
+
 
 EVENT_TIMER = "eTimer"
+EVENT_METRICS = "eMetrics"
+EVENT_HANDLER_ERROR = "eHandlerError"
+EVENT_HANDLER_SLOW = "eHandlerSlow"
+
+ALERT_TYPES = {EVENT_HANDLER_ERROR, EVENT_HANDLER_SLOW}
+
+DEFAULT_LANE = "default"
+
+# Smaller value means higher priority
+DEFAULT_PRIORITY = 10
 
 
 class Event:
@@ -26,9 +44,315 @@ class Event:
         self.data: Any = data
 
 
+class HandlerAlert:
+    """
+    Alert data of handler which raised exception or ran overtime.
+    """
+
+    def __init__(self, handler: str, type: str, msg: str, cost: float = 0) -> None:
+        """"""
+        self.handler: str = handler
+        self.type: str = type
+        self.msg: str = msg
+        self.cost: float = cost
+
+    def __str__(self) -> str:
+        """"""
+        if self.cost:
+            title: str = f"Handler {self.handler} of {self.type} has been running for {self.cost:.3f}s"
+        else:
+            title = f"Handler {self.handler} of {self.type} raised exception"
+
+        return f"{title}\n{self.msg}"
+
+
 # Defines handler function to be used in event engine.
 HandlerType = Callable[[Event], None]
 
+# Defines batch handler function which processes a list of events.
+BatchHandlerType = Callable[[list[Event]], None]
+
+
+class PrefixMap:
+    """
+    Map event type to value by longest prefix matching.
+
+    Results are cached by event type, so the matching cost is
+    only paid when a type is seen for the first time.
+    """
+
+    # Max number of event types cached
+    cache_size: int = 100_000
+
+    def __init__(self, default: Any) -> None:
+        """"""
+        self.default: Any = default
+
+        self._prefixes: dict[str, Any] = {}
+        self._routes: list[tuple[str, Any]] = []
+        self._cache: dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        """"""
+        return bool(self._prefixes)
+
+    def set(self, prefix: str, value: Any) -> None:
+        """
+        Set value of a type prefix.
+        """
+        self._prefixes[prefix] = value
+
+        # Longest prefix is matched first
+        self._routes = sorted(self._prefixes.items(), key=lambda route: len(route[0]), reverse=True)
+        self._cache = {}
+
+    def get(self, type: str) -> Any:
+        """
+        Get value of an event type.
+        """
+        cache: dict[str, Any] = self._cache
+
+        if type in cache:
+            return cache[type]
+
+        value: Any = self.default
+        for prefix, route_value in self._routes:
+            if type.startswith(prefix):
+                value = route_value
+                break
+
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[type] = value
+
+        return value
+
+
+class EventQueue(Queue):
+    """
+    FIFO event queue with optional conflation.
+
+    For event types enabled in conflation map, only the latest
+    undelivered event of each (type, vt_symbol) key is kept. The
+    newer event replaces the pending one while keeping its position
+    in the queue, so memory is bounded by the number of keys and
+    handlers always get the freshest data.
+    """
+
+    def __init__(self, conflation_map: PrefixMap | None = None) -> None:
+        """"""
+        self._conflation_map: PrefixMap | None = conflation_map
+        self._latest: dict[tuple[str, str], Event] = {}
+
+        super().__init__()
+
+    def _conflate(self, event: Event) -> bool:
+        """
+        Return True if the event replaced a pending one with same key.
+        """
+        if not self._conflation_map or not self._conflation_map.get(event.type):
+            return False
+
+        vt_symbol: str | None = getattr(event.data, "vt_symbol", None)
+        if vt_symbol is None:
+            return False
+
+        key: tuple[str, str] = (event.type, vt_symbol)
+        replaced: bool = key in self._latest
+        self._latest[key] = event
+        return replaced
+
+    def _resolve(self, event: Event) -> Event:
+        """
+        Return the latest event with same key of the event popped.
+        """
+        if not self._latest:
+            return event
+
+        vt_symbol: str | None = getattr(event.data, "vt_symbol", None)
+        if vt_symbol is None:
+            return event
+
+        latest: Event | None = self._latest.pop((event.type, vt_symbol), None)
+        return latest or event
+
+    def _put(self, event: Event) -> None:
+        """"""
+        if not self._conflate(event):
+            self.queue.append(event)
+
+    def _get(self) -> Event:
+        """"""
+        return self._resolve(self.queue.popleft())
+
+    def get_batch(self, max_count: int, timeout: float) -> list[Event]:
+        """
+        Get up to max_count events (all available if 0) at one time.
+        Empty list is returned if no event arrives before timeout.
+        """
+        with self.not_empty:
+            if not self._qsize():
+                self.not_empty.wait(timeout)
+
+            events: list[Event] = []
+
+            while self._qsize():
+                events.append(self._get())
+
+                if len(events) == max_count:
+                    break
+
+            if events:
+                self.not_full.notify()
+
+        return events
+
+
+class PriorityEventQueue(EventQueue):
+    """
+    Event queue which returns event with higher priority first,
+    events with same priority are returned in FIFO order.
+    """
+
+    def __init__(
+        self,
+        priority_map: PrefixMap,
+        conflation_map: PrefixMap | None = None
+    ) -> None:
+        """"""
+        self._priority_map: PrefixMap = priority_map
+        self._count: count = count()
+
+        super().__init__(conflation_map)
+
+    def _init(self, maxsize: int) -> None:
+        """"""
+        self.queue: list = []
+
+    def _qsize(self) -> int:
+        """"""
+        return len(self.queue)
+
+    def _put(self, event: Event) -> None:
+        """"""
+        if self._conflate(event):
+            return
+
+        priority: int = self._priority_map.get(event.type)
+        heappush(self.queue, (priority, next(self._count), event))
+
+    def _get(self) -> Event:
+        """"""
+        return self._resolve(heappop(self.queue)[2])
+
+
+class DequeEventQueue:
+    """
+    Event queue based on deque without lock, which is only safe for
+    one consumer thread (e.g. worker thread of a lane).
+
+    Appending to deque is atomic, so put of producer only needs to
+    signal when consumer thread is waiting on an empty queue.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.queue: deque = deque()
+
+        self._signal: ThreadEvent = ThreadEvent()
+        self._waiting: bool = False
+
+    def qsize(self) -> int:
+        """"""
+        return len(self.queue)
+
+    def put(self, event: Event) -> None:
+        """"""
+        self.queue.append(event)
+
+        if self._waiting:
+            self._signal.set()
+
+    def _wait(self, timeout: float | None) -> bool:
+        """
+        Wait until queue is not empty, return False if timeout.
+        """
+        # Waiting flag is set before checking the queue again, so that
+        # any event put after the check will trigger the signal.
+        self._signal.clear()
+        self._waiting = True
+
+        if not self.queue:
+            self._signal.wait(timeout)
+
+        self._waiting = False
+        return bool(self.queue)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Event:
+        """"""
+        if not self.queue and (not block or not self._wait(timeout)):
+            raise Empty
+
+        event: Event = self.queue.popleft()
+        return event
+
+    def get_batch(self, max_count: int, timeout: float) -> list[Event]:
+        """
+        Get up to max_count events (all available if 0) at one time.
+        Empty list is returned if no event arrives before timeout.
+        """
+        queue: deque = self.queue
+
+        if not queue and not self._wait(timeout):
+            return []
+
+        if not max_count:
+            max_count = len(queue)
+
+        events: list[Event] = []
+
+        while queue and len(events) < max_count:
+            events.append(queue.popleft())
+
+        return events
+
+
+# Queue types used by event lane
+LaneQueue = EventQueue | DequeEventQueue
+
+
+class TimerTask:
+    """
+    Periodic task scheduled by the timer thread of event engine.
+    """
+
+    def __init__(self, interval: float, callback: Callable[[], None]) -> None:
+        """"""
+        self.interval: float = interval
+        self.callback: Callable[[], None] = callback
+        self.active: bool = True
+
+
+class EventLane:
+    """
+    Event lane owns an independent queue and worker thread.
+
+    Events are routed into lanes by prefix of their type, so all
+    events of the same type go through the same lane and keep
+    their original order.
+    """
+
+    def __init__(self, name: str, queue: LaneQueue) -> None:
+        """"""
+        self.name: str = name
+        self.queue: LaneQueue = queue
+        self.thread: Thread | None = None
+        self.metrics: LaneMetrics | None = None
+
+        # Handler running in worker thread: (handler, type, start time)
+        self.running: tuple[Callable, str, float] | None = None
+        self.alerted: tuple[Callable, str, float] | None = None
+
 
 class EventEngine:
     """
@@ -36,33 +360,197 @@ class EventEngine:
     to those handlers registered.
 
     It also generates timer event by every interval seconds,
-    which can be used for timing purpose.
+    which can be used for timing purpose. Additional named timers
+    with their own intervals can be added by add_timer, all timers
+    are scheduled by one thread with monotonic deadlines, so they
+    do not drift with the time cost of processing.
+
+    By default all events are processed by one worker thread.
+    Optional lanes can be configured to dispatch different kinds
+    of events (e.g. trading, market data, log) by separate worker
+    threads, so that a burst of ticks will not delay the processing
+    of orders and trades.
+
+    Optional priorities can also be configured, so that queued events
+    with higher priority (e.g. trade) are processed before those with
+    lower priority (e.g. tick) in the same lane.
+
+    Optional conflation can be enabled for market data events, so
+    that slow handlers only process the latest snapshot of each
+    vt_symbol instead of working through stale backlog.
+
+    Optional batch mode can be enabled, so that the worker thread
+    drains multiple events from queue at each wakeup. Batch handlers
+    registered by register_batch then receive a list of events of
+    their type, which reduces per-event overhead.
+
+    Optional metrics can be enabled to record queue depth, event rate
+    and handler execution cost, which are emitted periodically as
+    metrics event and can also be queried by get_metrics.
+
+    Exceptions raised by handlers are captured and reported as handler
+    error event. Optional watchdog can be enabled to report handlers
+    running over time budget as handler slow event.
     """
 
-    def __init__(self, interval: int = 1) -> None:
+    def __init__(
+        self,
+        interval: float = 1,
+        lanes: dict[str, list[str]] | None = None,
+        priorities: dict[str, int] | None = None,
+        conflations: list[str] | None = None,
+        batch_size: int = 1,
+        metrics_interval: float = 0,
+        watchdog_timeout: float = 0,
+        backend: str = "queue"
+    ) -> None:
         """
         Timer event is generated every 1 second by default, if
-        interval not specified.
+        interval not specified. Fractional interval is supported.
+
+        Lanes is a dict of lane name to event type prefixes, e.g.
+        {"trading": ["eOrder.", "eTrade."], "market": ["eTick."]}.
+        Event types not matched by any prefix go to the default lane.
+
+        Priorities is a dict of event type prefix to priority value,
+        e.g. {"eTrade.": 0, "eOrder.": 0, "eTick.": 20}. Smaller value
+        means higher priority, and DEFAULT_PRIORITY is used for event
+        types not matched.
+
+        Conflations is a list of event type prefixes, e.g. ["eTick."].
+        Events of these types with data object of same vt_symbol are
+        conflated in the queue.
+
+        Batch size is the max number of events processed by a worker
+        at each wakeup, 0 means all events available in the queue.
+
+        Metrics interval is the seconds between two metrics events,
+        0 means metrics is disabled.
+
+        Watchdog timeout is the time budget in seconds of one handler
+        call, handlers running longer are reported with stack trace,
+        0 means watchdog is disabled.
+
+        Backend is the type of event queue: "queue" is based on locked
+        queue.Queue and supports priorities and conflations, "deque" is
+        based on collections.deque without lock for faster put and get.
         """
-        self._interval: int = interval
-        self._queue: Queue = Queue()
+        if interval <= 0:
+            raise ValueError(f"Invalid timer interval: {interval}")
+        elif metrics_interval < 0:
+            raise ValueError(f"Invalid metrics interval: {metrics_interval}")
+        elif batch_size < 0:
+            raise ValueError(f"Invalid batch size: {batch_size}")
+        elif watchdog_timeout < 0:
+            raise ValueError(f"Invalid watchdog timeout: {watchdog_timeout}")
+
+        if backend not in {"queue", "deque"}:
+            raise ValueError(f"Invalid event queue backend: {backend}")
+        elif backend == "deque" and (priorities is not None or conflations):
+            raise ValueError("Priorities and conflations are not supported by deque backend")
+        self._backend: str = backend
+
+        self._interval: float = interval
         self._active: bool = False
-        self._thread: Thread = Thread(target=self._run)
         self._timer: Thread = Thread(target=self._run_timer)
+        self._timer_condition: Condition = Condition()
+        self._timer_heap: list[tuple[float, int, TimerTask]] = []
+        self._timer_tasks: dict[str, TimerTask] = {}
+        self._timer_count: count = count()
         self._handlers: defaultdict = defaultdict(list)
         self._general_handlers: list = []
+        self._batch_handlers: defaultdict = defaultdict(list)
+        self._batch_size: int = batch_size
+
+        self._priority_map: PrefixMap | None = None
+        if priorities is not None:
+            self._priority_map = PrefixMap(DEFAULT_PRIORITY)
+
+            for prefix, priority in priorities.items():
+                self._priority_map.set(prefix, priority)
+
+        self._conflation_map: PrefixMap | None = None
+        if conflations:
+            self._conflation_map = PrefixMap(False)
+
+            for prefix in conflations:
+                self._conflation_map.set(prefix, True)
+
+        self._default_lane: EventLane = self._new_lane(DEFAULT_LANE)
+        self._lanes: dict[str, EventLane] = {DEFAULT_LANE: self._default_lane}
+        self._lane_map: PrefixMap = PrefixMap(self._default_lane)
+
+        if lanes:
+            for name, prefixes in lanes.items():
+                lane: EventLane | None = self._lanes.get(name, None)
+                if not lane:
+                    lane = self._new_lane(name)
+                    self._lanes[name] = lane
+
+                for prefix in prefixes:
+                    self._lane_map.set(prefix, lane)
+
+        self._metrics_interval: float = metrics_interval
+        self._metrics: EventMetrics | None = None
+
+        if metrics_interval:
+            self._metrics = EventMetrics()
 
-    def _run(self) -> None:
+            for lane in self._lanes.values():
+                lane.metrics = self._metrics.add_lane(lane.name)
+
+        self._watchdog_timeout: float = watchdog_timeout
+
+        if batch_size == 1:
+            run: Callable = self._run
+        else:
+            run = self._run_batch
+
+        for lane in self._lanes.values():
+            lane.thread = Thread(target=run, args=(lane,), name=f"EventEngine-{lane.name}")
+
+    def _run(self, lane: EventLane) -> None:
         """
-        Get event from queue and then process it.
+        Get event from queue of the lane and then process it.
         """
+        queue: LaneQueue = lane.queue
+        traced: bool = self._is_traced(lane)
+
         while self._active:
             try:
-                event: Event = self._queue.get(block=True, timeout=1)
-                self._process(event)
+                event: Event = queue.get(block=True, timeout=1)
+
+                if traced:
+                    self._process_traced(event, lane)
+                else:
+                    self._process(event)
+
+                if self._batch_handlers:
+                    self._process_batch_handlers([event], lane)
             except Empty:
                 pass
 
+    def _run_batch(self, lane: EventLane) -> None:
+        """
+        Get a batch of events from queue of the lane and then process them.
+        """
+        queue: LaneQueue = lane.queue
+        traced: bool = self._is_traced(lane)
+
+        while self._active:
+            events: list[Event] = queue.get_batch(self._batch_size, 1)
+            if not events:
+                continue
+
+            for event in events:
+                if traced:
+                    self._process_traced(event, lane)
+                else:
+                    self._process(event)
+
+            if self._batch_handlers:
+                self._process_batch_handlers(events, lane)
+
     def _process(self, event: Event) -> None:
         """
         First distribute event to those handlers registered listening
@@ -70,28 +558,226 @@ class EventEngine:
 
         Then distribute event to those general handlers which listens
         to all types.
+
+        Exception raised by one handler is captured and reported, so
+        it will not affect other handlers or the worker thread.
+        """
+        if event.type in self._handlers:
+            for handler in self._handlers[event.type]:
+                try:
+                    handler(event)
+                except Exception:
+                    self._on_handler_error(handler, event.type)
+
+        if self._general_handlers:
+            for handler in self._general_handlers:
+                try:
+                    handler(event)
+                except Exception:
+                    self._on_handler_error(handler, event.type)
+
+    def _process_traced(self, event: Event, lane: EventLane) -> None:
         """
+        Same as _process, but also trace handlers for metrics and watchdog.
+        """
+        if lane.metrics:
+            lane.metrics.add_event(event.type)
+
         if event.type in self._handlers:
-            [handler(event) for handler in self._handlers[event.type]]
+            for handler in self._handlers[event.type]:
+                self._call_traced(handler, event, event.type, lane)
 
         if self._general_handlers:
-            [handler(event) for handler in self._general_handlers]
+            for handler in self._general_handlers:
+                self._call_traced(handler, event, event.type, lane)
+
+    def _process_batch_handlers(self, events: list[Event], lane: EventLane) -> None:
+        """
+        Group events by type and distribute them to batch handlers,
+        which is called after all events are processed by ordinary
+        handlers.
+        """
+        traced: bool = self._is_traced(lane)
+        batches: defaultdict = defaultdict(list)
+
+        for event in events:
+            if event.type in self._batch_handlers:
+                batches[event.type].append(event)
+
+        for type, batch in batches.items():
+            for handler in self._batch_handlers[type]:
+                if traced:
+                    self._call_traced(handler, batch, type, lane)
+                    continue
+
+                try:
+                    handler(batch)
+                except Exception:
+                    self._on_handler_error(handler, type)
+
+    def _is_traced(self, lane: EventLane) -> bool:
+        """
+        Check if handlers of the lane need to be traced.
+        """
+        return bool(lane.metrics) or bool(self._watchdog_timeout)
+
+    def _call_traced(self, handler: Callable, data: Any, type: str, lane: EventLane) -> None:
+        """
+        Call handler with its running state recorded in the lane.
+        """
+        start: float = perf_counter()
+        lane.running = (handler, type, start)
+
+        try:
+            handler(data)
+        except Exception:
+            self._on_handler_error(handler, type)
+
+        lane.running = None
+
+        if lane.metrics:
+            lane.metrics.add_cost(handler, perf_counter() - start)
+
+    def _on_handler_error(self, handler: Callable, type: str) -> None:
+        """
+        Report exception raised by handler.
+        """
+        alert: HandlerAlert = HandlerAlert(get_handler_name(handler), type, traceback.format_exc())
+        self._put_alert(EVENT_HANDLER_ERROR, alert)
+
+    def _put_alert(self, type: str, alert: HandlerAlert) -> None:
+        """
+        Put alert event. The alert is printed instead if no handler
+        listens to it, or it is raised by handler of alert event.
+        """
+        if type not in self._handlers or alert.type in ALERT_TYPES:
+            print(alert, file=sys.stderr)
+        else:
+            self.put(Event(type, alert))
+
+    def _check_handlers(self) -> None:
+        """
+        Check running handler of each lane, and report those running
+        over watchdog timeout with stack trace of the worker thread.
+        """
+        now: float = perf_counter()
+
+        for lane in self._lanes.values():
+            running: tuple[Callable, str, float] | None = lane.running
+            if not running or running is lane.alerted:
+                continue
+
+            handler, type, start = running
+            cost: float = now - start
+            if cost < self._watchdog_timeout:
+                continue
+
+            lane.alerted = running
+
+            stack: str = ""
+            if lane.thread and lane.thread.ident:
+                frame: FrameType | None = sys._current_frames().get(lane.thread.ident, None)
+                if frame:
+                    stack = "".join(traceback.format_stack(frame))
+
+            alert: HandlerAlert = HandlerAlert(get_handler_name(handler), type, stack, cost)
+            self._put_alert(EVENT_HANDLER_SLOW, alert)
 
     def _run_timer(self) -> None:
         """
-        Sleep by interval second(s) and then generate a timer event.
+        Wait until the deadline of the next timer task and then run it.
+
+        Next deadline of a task is calculated from its last deadline
+        instead of current time, so timer does not drift. Deadlines
+        missed (e.g. system busy) are skipped instead of fired in burst.
+        Exception raised by task is reported, and the task keeps running.
         """
-        while self._active:
-            sleep(self._interval)
-            event: Event = Event(EVENT_TIMER)
-            self.put(event)
+        heap: list[tuple[float, int, TimerTask]] = self._timer_heap
+
+        with self._timer_condition:
+            while self._active:
+                now: float = monotonic()
+
+                while heap and heap[0][0] <= now:
+                    deadline, _, task = heappop(heap)
+                    if not task.active:
+                        continue
+
+                    try:
+                        task.callback()
+                    except Exception:
+                        self._on_handler_error(task.callback, EVENT_TIMER)
+
+                    missed: float = (now - deadline) // task.interval
+                    deadline += (missed + 1) * task.interval
+                    heappush(heap, (deadline, next(self._timer_count), task))
+
+                if heap:
+                    self._timer_condition.wait(heap[0][0] - monotonic())
+                else:
+                    self._timer_condition.wait()
+
+    def _schedule(self, task: TimerTask) -> None:
+        """
+        Schedule a timer task with first deadline after one interval.
+        """
+        with self._timer_condition:
+            deadline: float = monotonic() + task.interval
+            heappush(self._timer_heap, (deadline, next(self._timer_count), task))
+            self._timer_condition.notify()
+
+    def _put_timer(self, type: str) -> None:
+        """
+        Put timer event of specific type.
+        """
+        self.put(Event(type))
+
+    def _sample_metrics(self) -> None:
+        """
+        Record queue depth of all lanes.
+        """
+        for lane in self._lanes.values():
+            if lane.metrics:
+                lane.metrics.add_depth(lane.queue.qsize())
+
+    def _put_metrics(self) -> None:
+        """
+        Put metrics event with snapshot of metrics.
+        """
+        self.put(Event(EVENT_METRICS, self.get_metrics()))
+
+    def _new_lane(self, name: str) -> EventLane:
+        """
+        Create a new lane with queue type according to engine setting.
+        """
+        if self._backend == "deque":
+            queue: LaneQueue = DequeEventQueue()
+        elif self._priority_map is not None:
+            queue = PriorityEventQueue(self._priority_map, self._conflation_map)
+        else:
+            queue = EventQueue(self._conflation_map)
+
+        return EventLane(name, queue)
 
     def start(self) -> None:
         """
         Start event engine to process events and generate timer events.
         """
         self._active = True
-        self._thread.start()
+
+        for lane in self._lanes.values():
+            if lane.thread:
+                lane.thread.start()
+
+        self._schedule(TimerTask(self._interval, partial(self._put_timer, EVENT_TIMER)))
+
+        if self._metrics:
+            self._schedule(TimerTask(SAMPLE_INTERVAL, self._sample_metrics))
+            self._schedule(TimerTask(self._metrics_interval, self._put_metrics))
+
+        if self._watchdog_timeout:
+            self._schedule(TimerTask(self._watchdog_timeout / 2, self._check_handlers))
+
         self._timer.start()
 
     def stop(self) -> None:
@@ -99,14 +785,82 @@ class EventEngine:
         Stop event engine.
         """
         self._active = False
+
+        with self._timer_condition:
+            self._timer_condition.notify()
         self._timer.join()
-        self._thread.join()
+
+        for lane in self._lanes.values():
+            if lane.thread:
+                lane.thread.join()
 
     def put(self, event: Event) -> None:
         """
         Put an event object into event queue.
         """
-        self._queue.put(event)
+        if self._lane_map:
+            self._lane_map.get(event.type).queue.put(event)
+        else:
+            self._default_lane.queue.put(event)
+
+    def get_lane_names(self) -> list[str]:
+        """
+        Get names of all lanes in event engine.
+        """
+        return list(self._lanes.keys())
+
+    def get_lane_name(self, type: str) -> str:
+        """
+        Get name of the lane which processes specific event type.
+        """
+        lane: EventLane = self._lane_map.get(type)
+        return lane.name
+
+    def add_timer(self, name: str, interval: float) -> str:
+        """
+        Add a named timer which generates timer event by every interval
+        seconds, and return the event type of the timer for register.
+
+        Interval of existing timer with same name is updated.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid timer interval: {interval}")
+
+        self.remove_timer(name)
+
+        task: TimerTask = TimerTask(interval, partial(self._put_timer, f"{EVENT_TIMER}.{name}"))
+        self._timer_tasks[name] = task
+        self._schedule(task)
+
+        return f"{EVENT_TIMER}.{name}"
+
+    def remove_timer(self, name: str) -> None:
+        """
+        Remove an existing named timer.
+        """
+        task: TimerTask | None = self._timer_tasks.pop(name, None)
+        if task:
+            task.active = False
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get snapshot dict of metrics, empty if metrics is disabled.
+        """
+        if not self._metrics:
+            return {}
+
+        depths: dict[str, int] = {
+            name: lane.queue.qsize() for name, lane in self._lanes.items()
+        }
+        return self._metrics.get_snapshot(depths)
+
+    def set_priority(self, prefix: str, priority: int) -> None:
+        """
+        Set priority of event types with specific prefix. Only takes
+        effect when event engine is created with priorities enabled.
+        """
+        if self._priority_map is not None:
+            self._priority_map.set(prefix, priority)
 
     def register(self, type: str, handler: HandlerType) -> None:
         """
@@ -129,10 +883,34 @@ class EventEngine:
         if not handler_list:
             self._handlers.pop(type)
 
+    def register_batch(self, type: str, handler: BatchHandlerType) -> None:
+        """
+        Register a new batch handler function for a specific event type,
+        which is called with a list of events of this type in each batch.
+        """
+        handler_list: list = self._batch_handlers[type]
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+    def unregister_batch(self, type: str, handler: BatchHandlerType) -> None:
+        """
+        Unregister an existing batch handler function.
+        """
+        handler_list: list = self._batch_handlers[type]
+
+        if handler in handler_list:
+            handler_list.remove(handler)
+
+        if not handler_list:
+            self._batch_handlers.pop(type)
+
     def register_general(self, handler: HandlerType) -> None:
         """
         Register a new handler function for all event types. Every
         function can only be registered once for each event type.
+
+        Note that with multiple lanes, general handlers may be called
+        concurrently from different worker threads.
         """
         if handler not in self._general_handlers:
             self._general_handlers.append(handler)
@@ -0,0 +1,246 @@
+"""
+Runtime metrics of event engine.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict, deque
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+
+# Upper bounds (in seconds) of buckets in handler cost histogram
+COST_BUCKETS: list[float] = [
+    0.000_001, 0.000_002, 0.000_005,
+    0.000_01, 0.000_02, 0.000_05,
+    0.000_1, 0.000_2, 0.000_5,
+    0.001, 0.002, 0.005,
+    0.01, 0.02, 0.05,
+    0.1, 0.2, 0.5,
+    1, 2, 5,
+]
+
+# Seconds between two samples of queue depth
+SAMPLE_INTERVAL: float = 1
+
+# Number of queue depth samples kept for each lane
+DEPTH_HISTORY: int = 60
+
+
+def get_category(type: str) -> str:
+    """
+    Get category of event type, which is the part before the first dot,
+    e.g. "eTick." for both "eTick." and "eTick.rb2501.SHFE".
+    """
+    n: int = type.find(".")
+
+    if n < 0:
+        return type
+    else:
+        return type[:n + 1]
+
+
+def get_handler_name(handler: Callable) -> str:
+    """
+    Get readable name of handler function.
+    """
+    name: str = getattr(handler, "__qualname__", "") or repr(handler)
+    module: str = getattr(handler, "__module__", "") or ""
+
+    if module:
+        return f"{module}.{name}"
+    else:
+        return name
+
+
+class HandlerStats:
+    """
+    Execution cost statistics of a handler with fixed bucket histogram.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.count: int = 0
+        self.total: float = 0
+        self.max: float = 0
+        self.buckets: list[int] = [0] * (len(COST_BUCKETS) + 1)
+
+    def add(self, cost: float) -> None:
+        """
+        Add one execution cost record.
+        """
+        self.count += 1
+        self.total += cost
+        self.buckets[bisect_left(COST_BUCKETS, cost)] += 1
+
+        if cost > self.max:
+            self.max = cost
+
+    def merge(self, other: "HandlerStats") -> None:
+        """
+        Merge records of another stats object.
+        """
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+
+    def get_percentile(self, percent: float) -> float:
+        """
+        Get estimated percentile cost, which is the upper bound of the
+        bucket containing the percentile, and no more than max cost.
+        """
+        if not self.count:
+            return 0
+
+        target: float = self.count * percent / 100
+        accumulated: int = 0
+
+        for i, n in enumerate(self.buckets):
+            accumulated += n
+
+            if accumulated >= target:
+                if i < len(COST_BUCKETS):
+                    return min(COST_BUCKETS[i], self.max)
+                break
+
+        return self.max
+
+    def to_dict(self) -> dict[str, float]:
+        """"""
+        if self.count:
+            mean: float = self.total / self.count
+        else:
+            mean = 0
+
+        return {
+            "count": self.count,
+            "mean": mean,
+            "p50": self.get_percentile(50),
+            "p99": self.get_percentile(99),
+            "max": self.max,
+        }
+
+
+class LaneMetrics:
+    """
+    Metrics collected by the worker thread of one event lane.
+
+    Each lane owns its own metrics object, so that counters are
+    only updated from one thread and no lock is required.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.event_counts: defaultdict[str, int] = defaultdict(int)
+        self.handler_stats: dict[Callable, HandlerStats] = {}
+        self.depths: deque[int] = deque(maxlen=DEPTH_HISTORY)
+        self.max_depth: int = 0
+
+    def add_event(self, type: str) -> None:
+        """
+        Count event processed.
+        """
+        self.event_counts[get_category(type)] += 1
+
+    def add_cost(self, handler: Callable, cost: float) -> None:
+        """
+        Record execution cost of handler.
+        """
+        stats: HandlerStats | None = self.handler_stats.get(handler, None)
+        if not stats:
+            stats = HandlerStats()
+            self.handler_stats[handler] = stats
+        stats.add(cost)
+
+    def add_depth(self, depth: int) -> None:
+        """
+        Record sample of queue depth.
+        """
+        self.depths.append(depth)
+
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+
+class EventMetrics:
+    """
+    Aggregate metrics of all lanes into a snapshot dict.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.lanes: dict[str, LaneMetrics] = {}
+
+        self.last_time: float = perf_counter()
+        self.last_counts: dict[str, int] = {}
+
+    def add_lane(self, name: str) -> LaneMetrics:
+        """
+        Create metrics object for a lane.
+        """
+        metrics: LaneMetrics = LaneMetrics()
+        self.lanes[name] = metrics
+        return metrics
+
+    def get_snapshot(self, depths: dict[str, int]) -> dict[str, Any]:
+        """
+        Get snapshot of all metrics. Event rate is calculated from
+        the change of event counts since last snapshot.
+        """
+        now: float = perf_counter()
+        elapsed: float = max(now - self.last_time, 1e-9)
+
+        # Queue depth
+        lane_data: dict[str, dict] = {}
+
+        for name, metrics in self.lanes.items():
+            lane_data[name] = {
+                "depth": depths.get(name, 0),
+                "max_depth": metrics.max_depth,
+                "history": list(metrics.depths),
+            }
+
+        # Event count and rate
+        counts: defaultdict[str, int] = defaultdict(int)
+
+        for metrics in self.lanes.values():
+            for category, n in metrics.event_counts.copy().items():
+                counts[category] += n
+
+        event_data: dict[str, dict] = {}
+
+        for category, n in counts.items():
+            last_n: int = self.last_counts.get(category, 0)
+            event_data[category] = {
+                "count": n,
+                "rate": (n - last_n) / elapsed,
+            }
+
+        # Handler execution cost
+        handler_stats: dict[str, HandlerStats] = {}
+
+        for metrics in self.lanes.values():
+            for handler, stats in metrics.handler_stats.copy().items():
+                handler_name: str = get_handler_name(handler)
+
+                total_stats: HandlerStats | None = handler_stats.get(handler_name, None)
+                if not total_stats:
+                    total_stats = HandlerStats()
+                    handler_stats[handler_name] = total_stats
+                total_stats.merge(stats)
+
+        handler_data: dict[str, dict] = {
+            name: stats.to_dict() for name, stats in handler_stats.items()
+        }
+
+        self.last_time = now
+        self.last_counts = dict(counts)
+
+        return {
+            "lanes": lane_data,
+            "events": event_data,
+            "handlers": handler_data,
+        }
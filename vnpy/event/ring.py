@@ -0,0 +1,299 @@
+"""
+Shared memory ring buffer for fanning out events to worker processes.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from multiprocessing import Event as ProcessEvent, Process
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event as ProcessEventType
+from struct import Struct
+from threading import Lock
+from time import sleep
+
+from .engine import Event, EventEngine
+
+
+# Header: write sequence, capacity, record size
+HEADER: Struct = Struct("<QQQ")
+
+# Sequence number stamp of each slot, written after record data
+STAMP: Struct = Struct("<Q")
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attach to existing shared memory without taking its ownership.
+
+    Before Python 3.13 the attached memory is also registered into the
+    resource tracker, which is shared with the producer process when
+    worker is started by multiprocessing, so no extra handling needed.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)     # type: ignore
+    else:
+        return SharedMemory(name=name)
+
+
+class RecordCodec(ABC):
+    """
+    Abstract codec for converting event to fixed size record.
+    """
+
+    # Max size in bytes of record
+    record_size: int = 0
+
+    @abstractmethod
+    def encode(self, event: Event) -> bytes | None:
+        """
+        Encode event into record, return None if not supported.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> list[Event]:
+        """
+        Decode record into events.
+        """
+        pass
+
+
+class SharedRingBuffer:
+    """
+    Ring buffer of fixed size records in shared memory, which is
+    written by one producer and read by many consumer processes.
+
+    Producer never blocks. Each slot is stamped with its sequence
+    number after data is written, so consumers can detect slots
+    which are not ready or have been overwritten by a lapping
+    producer, and records lost are skipped.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        record_size: int = 0,
+        capacity: int = 0,
+        create: bool = False
+    ) -> None:
+        """
+        Create new ring buffer if create is True, otherwise attach to
+        existing one with specific name.
+        """
+        if create:
+            slot_size: int = (STAMP.size + record_size + 7) // 8 * 8
+            size: int = HEADER.size + slot_size * capacity
+
+            self._shm: SharedMemory = SharedMemory(name=name or None, create=True, size=size)
+        else:
+            self._shm = attach_shared_memory(name)
+
+        self.name: str = self._shm.name
+        self.owner: bool = create
+        self.lost: int = 0
+
+        self._buf: memoryview = self._shm.buf      # type: ignore
+
+        if create:
+            HEADER.pack_into(self._buf, 0, 0, capacity, record_size)
+
+        self._write_seq, self.capacity, self.record_size = HEADER.unpack_from(self._buf, 0)
+        self._slot_size: int = (STAMP.size + self.record_size + 7) // 8 * 8
+
+    def write(self, data: bytes) -> None:
+        """
+        Write one record into ring buffer, only called by producer.
+        """
+        if len(data) > self.record_size:
+            raise ValueError(f"Record size {len(data)} exceeds max size {self.record_size}")
+
+        buf: memoryview = self._buf
+        seq: int = self._write_seq
+        offset: int = HEADER.size + (seq % self.capacity) * self._slot_size
+        start: int = offset + STAMP.size
+
+        STAMP.pack_into(buf, offset, 0)
+        buf[start:start + len(data)] = data
+        STAMP.pack_into(buf, offset, seq + 1)
+
+        self._write_seq = seq + 1
+        HEADER.pack_into(buf, 0, seq + 1, self.capacity, self.record_size)
+
+    def get_write_seq(self) -> int:
+        """
+        Get sequence number of next record to be written.
+        """
+        write_seq: int = HEADER.unpack_from(self._buf, 0)[0]
+        return write_seq
+
+    def read(self, seq: int) -> tuple[list[bytes], int]:
+        """
+        Read records from sequence number until latest, return records
+        and the sequence number to read next time.
+        """
+        buf: memoryview = self._buf
+        write_seq: int = self.get_write_seq()
+
+        # Skip records already overwritten
+        if write_seq - seq > self.capacity:
+            self.lost += write_seq - self.capacity - seq
+            seq = write_seq - self.capacity
+
+        records: list[bytes] = []
+
+        while seq < write_seq:
+            offset: int = HEADER.size + (seq % self.capacity) * self._slot_size
+            start: int = offset + STAMP.size
+            stamp: int = seq + 1
+
+            if STAMP.unpack_from(buf, offset)[0] == stamp:
+                data: bytes = bytes(buf[start:start + self.record_size])
+
+                # Check again in case slot was overwritten while copying
+                if STAMP.unpack_from(buf, offset)[0] == stamp:
+                    records.append(data)
+                else:
+                    self.lost += 1
+            else:
+                self.lost += 1
+
+            seq += 1
+
+        return records, seq
+
+    def close(self) -> None:
+        """
+        Close access to shared memory, and release it if owned.
+        """
+        self._shm.close()
+
+        if self.owner:
+            self._shm.unlink()
+
+
+class RingPublisher:
+    """
+    Publish events of selected types from event engine into shared
+    memory ring buffer, which can be consumed by RingWorker processes.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        codec: RecordCodec,
+        types: list[str],
+        capacity: int = 65536,
+        name: str = ""
+    ) -> None:
+        """"""
+        self.event_engine: EventEngine = event_engine
+        self.codec: RecordCodec = codec
+        self.types: list[str] = types
+
+        self.ring: SharedRingBuffer = SharedRingBuffer(name, codec.record_size, capacity, create=True)
+        self.name: str = self.ring.name
+
+        # Events of different types may be processed by different lanes
+        self.lock: Lock = Lock()
+
+        for type in types:
+            self.event_engine.register(type, self.process_event)
+
+    def process_event(self, event: Event) -> None:
+        """"""
+        data: bytes | None = self.codec.encode(event)
+        if data is None:
+            return
+
+        with self.lock:
+            self.ring.write(data)
+
+    def close(self) -> None:
+        """
+        Stop publishing and release the ring buffer.
+        """
+        for type in self.types:
+            self.event_engine.unregister(type, self.process_event)
+
+        with self.lock:
+            self.ring.close()
+
+
+def run_ring_worker(
+    name: str,
+    codec: RecordCodec,
+    setup: Callable[[EventEngine], None],
+    stop_event: ProcessEventType,
+    poll_interval: float
+) -> None:
+    """
+    Main function of worker process: read records from ring buffer
+    and put decoded events into a local event engine, which runs
+    handlers registered by setup function.
+    """
+    ring: SharedRingBuffer = SharedRingBuffer(name)
+
+    event_engine: EventEngine = EventEngine()
+    setup(event_engine)
+    event_engine.start()
+
+    # Start from the latest record
+    seq: int = ring.get_write_seq()
+
+    while not stop_event.is_set():
+        records, seq = ring.read(seq)
+
+        if not records:
+            sleep(poll_interval)
+            continue
+
+        for data in records:
+            for event in codec.decode(data):
+                event_engine.put(event)
+
+    event_engine.stop()
+    ring.close()
+
+
+class RingWorker:
+    """
+    Worker process consuming events from shared memory ring buffer.
+
+    Setup function is called in the worker process with its own event
+    engine for registering handlers, so it should be a module level
+    function which can be pickled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        codec: RecordCodec,
+        setup: Callable[[EventEngine], None],
+        poll_interval: float = 0.0005
+    ) -> None:
+        """"""
+        self._stop_event: ProcessEventType = ProcessEvent()
+        self._process: Process = Process(
+            target=run_ring_worker,
+            args=(name, codec, setup, self._stop_event, poll_interval),
+            daemon=True
+        )
+
+    def start(self) -> None:
+        """
+        Start worker process.
+        """
+        self._process.start()
+
+    def stop(self) -> None:
+        """
+        Stop worker process.
+        """
+        self._stop_event.set()
+
+    def join(self) -> None:
+        """
+        Wait for worker process to exit.
+        """
+        self._process.join()
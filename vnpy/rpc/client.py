@@ -1,11 +1,24 @@
+import asyncio
+import json
 import threading
+import traceback
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from itertools import count
 from time import time
 from functools import lru_cache
 from typing import Any
 
 import zmq
 
-from .common import HEARTBEAT_TOPIC, HEARTBEAT_TOLERANCE
+from .common import (
+    HEARTBEAT_TOPIC,
+    HEARTBEAT_TOLERANCE,
+    HANDSHAKE_REQUEST,
+    HANDSHAKE_FLAG,
+    HANDSHAKE_TIMEOUT,
+    TOPIC_FLAG
+)
+from .serializer import Serializer, get_serializer
 
 
 class RemoteException(Exception):
@@ -27,18 +40,62 @@ class RemoteException(Exception):
 
 
 class RpcClient:
-    """"""
+    """
+    If pipeline is True, a DEALER socket is used for sending requests,
+    each request is tagged with an id and many calls can be in flight
+    at the same time. Call submit or call_async to get a future of
+    the result without waiting.
+
+    Serializers are the names of serializers accepted by client in
+    order of preference. Serializer is negotiated with server when
+    started, and the first one accepted by server is used for requests.
+    Server of old version only accepts and publishes pickle. Data
+    received is only loaded by accepted serializers, and dropped if not.
+
+    Topics are subscribed by topic frame of messages published, which
+    is filtered inside zmq. Data published by server of old version,
+    or while any subscriber of old version connected, has no topic
+    frame, which is received by subscription of serializer codes and
+    filtered by topics subscribed after loaded.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, pipeline: bool = False, serializers: list[str] | None = None) -> None:
         """Constructor"""
+        # Serializers related, accepted serializers are keyed by code
+        if not serializers:
+            serializers = ["pickle"]
+
+        self._serializer_names: list[str] = serializers
+        self._serializer: Serializer = get_serializer(serializers[0])
+        self._serializers: dict[int, Serializer] = {}
+
+        for name in serializers:
+            serializer: Serializer = get_serializer(name)
+            self._serializers[serializer.code] = serializer
+
         # zmq port related
         self._context: zmq.Context = zmq.Context()
 
         # Request socket (Request–reply pattern)
-        self._socket_req: zmq.Socket = self._context.socket(zmq.REQ)
+        self._pipeline: bool = pipeline
+
+        if pipeline:
+            self._socket_req: zmq.Socket = self._context.socket(zmq.DEALER)
+        else:
+            self._socket_req = self._context.socket(zmq.REQ)
+
+            # Allow sending again after timeout, and drop late replies
+            self._socket_req.setsockopt(zmq.REQ_RELAXED, 1)
+            self._socket_req.setsockopt(zmq.REQ_CORRELATE, 1)
 
         # Subscribe socket (Publish–subscribe pattern)
         self._socket_sub: zmq.Socket = self._context.socket(zmq.SUB)
+        self._topics: set[str] = set()
+
+        self._socket_sub.setsockopt(zmq.SUBSCRIBE, TOPIC_FLAG + HEARTBEAT_TOPIC.encode())
+
+        for code in self._serializers.keys():
+            self._socket_sub.setsockopt(zmq.SUBSCRIBE, bytes([code]))
 
         # Set socket option to keepalive
         for socket in [self._socket_req, self._socket_sub]:
@@ -52,6 +109,15 @@ class RpcClient:
 
         self._last_received_ping: float = time()
 
+        # Pipeline related, requests are passed to request thread by
+        # inproc socket, and responses are set into futures by id
+        self._request_thread: threading.Thread | None = None
+        self._request_address: str = f"inproc://rpc_request_{id(self)}"
+        self._socket_pull: zmq.Socket = self._context.socket(zmq.PULL)
+        self._socket_push: zmq.Socket = self._context.socket(zmq.PUSH)
+        self._request_ids: count = count()
+        self._futures: dict[bytes, Future] = {}
+
     @lru_cache(100)  # noqa
     def __getattr__(self, name: str) -> Any:
         """
@@ -65,9 +131,19 @@ class RpcClient:
             # Generate request
             req: list = [name, args, kwargs]
 
+            # Send request by pipeline and wait for future
+            if self._pipeline:
+                future: Future = self._send_request(req)
+
+                try:
+                    return future.result(timeout / 1000)
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise RemoteException(f"Timeout of {timeout}ms reached for {req}") from None
+
             # Send request and wait for response
             with self._lock:
-                self._socket_req.send_pyobj(req)
+                self._socket_req.send(self._serializer.dumps(req))
 
                 # Timeout reached without any data
                 n: int = self._socket_req.poll(timeout)
@@ -75,7 +151,7 @@ class RpcClient:
                     msg: str = f"Timeout of {timeout}ms reached for {req}"
                     raise RemoteException(msg)
 
-                rep = self._socket_req.recv_pyobj()
+                rep = self.loads(self._socket_req.recv())
 
             # Return response if successed; Trigger exception if failed
             if rep[0]:
@@ -85,6 +161,89 @@ class RpcClient:
 
         return dorpc
 
+    def submit(self, name: str, *args: Any, **kwargs: Any) -> Future:
+        """
+        Call remote function and return future of the result.
+        """
+        if self._pipeline:
+            return self._send_request([name, args, kwargs])
+
+        # Without pipeline, the call is finished before returning
+        future: Future = Future()
+
+        try:
+            future.set_result(self.__getattr__(name)(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+    def call_async(self, name: str, *args: Any, **kwargs: Any) -> asyncio.Future:
+        """
+        Call remote function and return awaitable future of the result,
+        should be called within a running event loop.
+        """
+        return asyncio.wrap_future(self.submit(name, *args, **kwargs))
+
+    def _send_request(self, req: list) -> Future:
+        """
+        Send request with new id to request thread.
+        """
+        request_id: bytes = str(next(self._request_ids)).encode()
+
+        future: Future = Future()
+        future.add_done_callback(lambda f: self._futures.pop(request_id, None))
+        self._futures[request_id] = future
+
+        # Id is sent as routing envelope, which is echoed back by server
+        with self._lock:
+            self._socket_push.send_multipart([request_id, b"", self._serializer.dumps(req)])
+
+        return future
+
+    def run_request(self) -> None:
+        """
+        Send requests to server and set responses into futures.
+        """
+        poller: zmq.Poller = zmq.Poller()
+        poller.register(self._socket_req, zmq.POLLIN)
+        poller.register(self._socket_pull, zmq.POLLIN)
+
+        while self._active:
+            events: dict = dict(poller.poll(1000))
+
+            if self._socket_pull in events:
+                self._socket_req.send_multipart(self._socket_pull.recv_multipart())
+
+            if self._socket_req in events:
+                frames: list[bytes] = self._socket_req.recv_multipart()
+                request_id: bytes = frames[0]
+                future: Future | None = self._futures.get(request_id, None)
+                if not future or not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    rep: list = self.loads(frames[-1])
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+
+                # Return response if successed; Trigger exception if failed
+                if rep[0]:
+                    future.set_result(rep[1])
+                else:
+                    future.set_exception(RemoteException(rep[1]))
+
+        # Cancel requests without response
+        for future in list(self._futures.values()):
+            future.cancel()
+
+        self._socket_req.close()
+        self._socket_pull.close()
+
+        with self._lock:
+            self._socket_push.close()
+
     def start(
         self,
         req_address: str,
@@ -100,6 +259,13 @@ class RpcClient:
         self._socket_req.connect(req_address)
         self._socket_sub.connect(sub_address)
 
+        # Negotiate serializer with server, which is optional for client
+        # of only pickle, so that it can be started before server
+        if self._serializer_names == ["pickle"]:
+            self.negotiate(HANDSHAKE_TIMEOUT, False)
+        else:
+            self.negotiate()
+
         # Start RpcClient status
         self._active = True
 
@@ -107,6 +273,14 @@ class RpcClient:
         self._thread = threading.Thread(target=self.run)
         self._thread.start()
 
+        # Start request thread for pipeline
+        if self._pipeline:
+            self._socket_pull.bind(self._request_address)
+            self._socket_push.connect(self._request_address)
+
+            self._request_thread = threading.Thread(target=self.run_request)
+            self._request_thread.start()
+
         self._last_received_ping = time()
 
     def stop(self) -> None:
@@ -125,6 +299,10 @@ class RpcClient:
             self._thread.join()
         self._thread = None
 
+        if self._request_thread and self._request_thread.is_alive():
+            self._request_thread.join()
+        self._request_thread = None
+
     def run(self) -> None:
         """
         Run RpcClient function
@@ -136,19 +314,84 @@ class RpcClient:
                 self.on_disconnected()
                 continue
 
-            # Receive data from subscribe socket
-            topic, data = self._socket_sub.recv_pyobj(flags=zmq.NOBLOCK)
+            # Receive data from subscribe socket, and filter message
+            # without topic frame by topics subscribed
+            frames: list[bytes] = self._socket_sub.recv_multipart(flags=zmq.NOBLOCK)
 
-            if topic == HEARTBEAT_TOPIC:
-                self._last_received_ping = data
-            else:
-                # Process data by callable function
-                self.callback(topic, data)
+            try:
+                message: list = self.loads(frames[-1])
+                topic: str = message[0]
+            except Exception:
+                print(f"RpcClient failed to load message published:\n{traceback.format_exc()}")
+                continue
 
-        # Close socket
-        self._socket_req.close()
+            if len(frames) == 1 and topic != HEARTBEAT_TOPIC and not self.match_topic(topic):
+                continue
+
+            # Message of batch mode has a flag appended and data is unbatched
+            if len(message) > 2:
+                batch: list = message[1]
+            else:
+                batch = [message[1]]
+
+            for data in batch:
+                if topic == HEARTBEAT_TOPIC:
+                    self._last_received_ping = data
+                else:
+                    # Process data by callable function
+                    self.callback(topic, data)
+
+        # Close socket, request socket is closed by request thread for pipeline
+        if not self._pipeline:
+            self._socket_req.close()
         self._socket_sub.close()
 
+    def negotiate(self, timeout: int = 30000, required: bool = True) -> None:
+        """
+        Choose serializer accepted by both client and server, and check
+        that data published by server can be loaded.
+
+        If not required, timeout is ignored and pickle is used.
+        """
+        with self._lock:
+            if self._pipeline:
+                self._socket_req.send_multipart([b"handshake", b"", HANDSHAKE_REQUEST])
+            else:
+                self._socket_req.send(HANDSHAKE_REQUEST)
+
+            if not self._socket_req.poll(timeout):
+                if not required:
+                    return
+                raise RemoteException(f"Timeout of {timeout}ms reached for negotiating serializer")
+
+            reply: bytes = self._socket_req.recv_multipart()[-1]
+
+        # Server of old version replies error of function not found
+        if reply[:1] == HANDSHAKE_FLAG:
+            setting: dict = json.loads(reply[1:])
+        else:
+            setting = {"serializers": ["pickle"], "publish_serializer": "pickle"}
+
+        for name in self._serializer_names:
+            if name in setting["serializers"]:
+                self._serializer = get_serializer(name)
+                break
+        else:
+            raise RemoteException(f"None of serializers {self._serializer_names} is accepted by server")
+
+        if setting["publish_serializer"] not in self._serializer_names:
+            raise RemoteException(f"Publish serializer {setting['publish_serializer']} is not accepted by client")
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Load data with the serializer it is dumped, if accepted.
+        """
+        serializer: Serializer | None = self._serializers.get(data[0], None)
+        if not serializer:
+            raise RemoteException(f"Serializer of code {data[0]} is not accepted by client")
+
+        return serializer.loads(data)
+
     def callback(self, topic: str, data: Any) -> None:
         """
         Callable function
@@ -159,7 +402,18 @@ class RpcClient:
         """
         Subscribe data
         """
-        self._socket_sub.setsockopt_string(zmq.SUBSCRIBE, topic)
+        self._topics.add(topic)
+        self._socket_sub.setsockopt(zmq.SUBSCRIBE, TOPIC_FLAG + topic.encode())
+
+    def match_topic(self, topic: str) -> bool:
+        """
+        Check whether topic matches any topic subscribed by prefix.
+        """
+        for prefix in self._topics:
+            if topic.startswith(prefix):
+                return True
+
+        return False
 
     def on_disconnected(self) -> None:
         """
@@ -1,3 +1,4 @@
+import pickle
 import signal
 
 
@@ -8,3 +9,15 @@ signal.signal(signal.SIGINT, signal.SIG_DFL)
 HEARTBEAT_TOPIC = "heartbeat"
 HEARTBEAT_INTERVAL = 10
 HEARTBEAT_TOLERANCE = 30
+
+# Handshake request for negotiating serializer, which is a pickled call
+# of function not existing, so that server of old version replies error
+# instead of crashing. Reply of new version starts with handshake flag.
+HANDSHAKE_REQUEST = pickle.dumps(["__handshake__", (), {}], protocol=4)
+HANDSHAKE_FLAG = b"\x00"
+
+# Milliseconds to wait for handshake reply if negotiating is optional
+HANDSHAKE_TIMEOUT = 3000
+
+# First byte of topic frame of multipart message published
+TOPIC_FLAG = b"\x00"
@@ -0,0 +1,261 @@
+"""
+Serializers of data transferred between RpcServer and RpcClient.
+
+Data serialized starts with a code byte identifying the serializer, so
+that receiver can decode data without knowing the sender's choice.
+Pickle data is sent as it is, as it always starts with PROTO opcode
+(0x80), which keeps compatible with clients and servers of old version.
+"""
+
+import pickle
+from abc import ABC, abstractmethod
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta
+from struct import Struct
+from enum import Enum
+from typing import Any
+from zoneinfo import ZoneInfo
+
+
+# Codes of serializers
+CODE_PICKLE: int = 0x80
+CODE_MSGPACK: int = 0x01
+CODE_OBJECT: int = 0x02
+
+# Msgpack extension type codes
+EXT_DATETIME: int = 1
+EXT_ENUM: int = 2
+EXT_DATACLASS: int = 3
+EXT_OBJECT: int = 4
+EXT_DATETIME_ISO: int = 5
+
+# Wall clock microseconds since epoch of datetime
+MICROS: Struct = Struct("<q")
+EPOCH: datetime = datetime(1970, 1, 1)
+MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+class Serializer(ABC):
+    """
+    Abstract serializer of RPC data.
+    """
+
+    name: str = ""
+    code: int = 0
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize object into bytes starting with code byte.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize bytes starting with code byte into object.
+        """
+        pass
+
+
+class PickleSerializer(Serializer):
+    """
+    Serializer with pickle, which supports any Python object, but
+    should only be used between trusted parties.
+    """
+
+    name: str = "pickle"
+    code: int = CODE_PICKLE
+
+    def dumps(self, obj: Any) -> bytes:
+        """"""
+        return pickle.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """"""
+        return pickle.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """
+    Serializer with msgpack, data objects and enums of vnpy.trader are
+    supported by extension types, and only these types can be created
+    when deserializing.
+
+    Tuple is deserialized as list. Datetime with ZoneInfo or without
+    timezone is encoded as wall clock microseconds with zone key.
+    """
+
+    name: str = "msgpack"
+    code: int = CODE_MSGPACK
+
+    def __init__(self) -> None:
+        """"""
+        import msgpack      # type: ignore
+        from vnpy.trader import constant, object
+
+        self.msgpack: Any = msgpack
+
+        # Types allowed to be created, by class name
+        self.types: dict[str, type] = {}
+
+        # Names of init fields of dataclasses
+        self.field_names: dict[type, list[str]] = {}
+
+        for module in [constant, object]:
+            for name, value in vars(module).items():
+                if not isinstance(value, type):
+                    continue
+
+                if issubclass(value, Enum):
+                    self.types[name] = value
+                elif is_dataclass(value):
+                    self.types[name] = value
+                    self.field_names[value] = [f.name for f in fields(value) if f.init]
+
+        # Extension types of enum members
+        self.enum_exts: dict[Enum, Any] = {}
+
+    def dumps(self, obj: Any) -> bytes:
+        """"""
+        data: bytes = self.msgpack.packb(obj, default=self.encode_ext)
+        return bytes([self.code]) + data
+
+    def loads(self, data: bytes) -> Any:
+        """"""
+        return self.msgpack.unpackb(memoryview(data)[1:], ext_hook=self.decode_ext, strict_map_key=False)
+
+    def encode_ext(self, obj: Any) -> Any:
+        """
+        Convert object not supported by msgpack into extension type.
+        """
+        packb: Any = self.msgpack.packb
+        ExtType: Any = self.msgpack.ExtType
+
+        if isinstance(obj, datetime):
+            tz: Any = obj.tzinfo
+
+            if tz is None:
+                micros: int = (obj - EPOCH) // MICROSECOND
+                return ExtType(EXT_DATETIME, MICROS.pack(micros))
+            elif isinstance(tz, ZoneInfo):
+                micros = (obj.replace(tzinfo=None) - EPOCH) // MICROSECOND
+                return ExtType(EXT_DATETIME, MICROS.pack(micros) + tz.key.encode())
+            else:
+                return ExtType(EXT_DATETIME_ISO, obj.isoformat().encode())
+        elif isinstance(obj, Enum):
+            ext: Any = self.enum_exts.get(obj, None)
+            if not ext:
+                ext = ExtType(EXT_ENUM, packb([type(obj).__name__, obj.value]))
+                self.enum_exts[obj] = ext
+            return ext
+
+        field_names: list[str] | None = self.field_names.get(type(obj), None)
+        if field_names is None:
+            raise TypeError(f"Unsupported type {type(obj).__name__}")
+
+        value: list = [
+            type(obj).__name__,
+            [getattr(obj, name) for name in field_names],
+            getattr(obj, "extra", None)
+        ]
+        return ExtType(EXT_DATACLASS, packb(value, default=self.encode_ext))
+
+    def decode_ext(self, code: int, data: bytes) -> Any:
+        """
+        Convert extension type back into object.
+        """
+        if code == EXT_DATETIME:
+            dt: datetime = EPOCH + MICROS.unpack_from(data)[0] * MICROSECOND
+            if len(data) > MICROS.size:
+                dt = dt.replace(tzinfo=ZoneInfo(data[MICROS.size:].decode()))
+            return dt
+        elif code == EXT_DATETIME_ISO:
+            return datetime.fromisoformat(data.decode())
+
+        value: Any = self.msgpack.unpackb(data, ext_hook=self.decode_ext, strict_map_key=False)
+
+        if code == EXT_ENUM:
+            return self.types[value[0]](value[1])
+        elif code == EXT_DATACLASS:
+            obj: Any = self.types[value[0]](*value[1])
+            if value[2] is not None:
+                obj.extra = value[2]
+            return obj
+        else:
+            return self.msgpack.ExtType(code, data)
+
+
+class ObjectSerializer(MsgpackSerializer):
+    """
+    Serializer with msgpack for containers, and ObjectCodec of
+    vnpy.trader for data objects, which is faster and more compact.
+
+    Pickle is not allowed in ObjectCodec, data object with extra is
+    encoded by msgpack extension type of dataclass instead.
+    """
+
+    name: str = "object"
+    code: int = CODE_OBJECT
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        from vnpy.trader.codec import ObjectCodec
+        self.codec: ObjectCodec = ObjectCodec()
+
+    def encode_ext(self, obj: Any) -> Any:
+        """"""
+        if self.codec.is_supported(obj) and getattr(obj, "extra", None) is None:
+            return self.msgpack.ExtType(EXT_OBJECT, self.codec.encode(obj))
+
+        return super().encode_ext(obj)
+
+    def decode_ext(self, code: int, data: bytes) -> Any:
+        """"""
+        if code == EXT_OBJECT:
+            return self.codec.decode(data)
+
+        return super().decode_ext(code, data)
+
+
+SERIALIZER_CLASSES: dict[str, type[Serializer]] = {
+    PickleSerializer.name: PickleSerializer,
+    MsgpackSerializer.name: MsgpackSerializer,
+    ObjectSerializer.name: ObjectSerializer,
+}
+
+# Created serializers by name
+serializers: dict[str, Serializer] = {}
+
+
+def get_serializer(name: str) -> Serializer:
+    """
+    Get serializer by name, which is created when first used.
+    """
+    serializer: Serializer | None = serializers.get(name, None)
+
+    if not serializer:
+        if name not in SERIALIZER_CLASSES:
+            raise ValueError(f"Unsupported serializer {name}")
+
+        serializer = SERIALIZER_CLASSES[name]()
+        serializers[name] = serializer
+
+    return serializer
+
+
+def get_serializer_by_code(code: int) -> Serializer | None:
+    """
+    Get serializer by the code byte of serialized data, None is returned
+    if not found or its dependency is not installed.
+    """
+    for name, cls in SERIALIZER_CLASSES.items():
+        if cls.code == code:
+            try:
+                return get_serializer(name)
+            except ImportError:
+                return None
+
+    return None
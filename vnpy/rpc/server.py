@@ -1,20 +1,77 @@
+import json
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from time import time
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from typing import Any
 
 import zmq
 
-from .common import HEARTBEAT_TOPIC, HEARTBEAT_INTERVAL
+from .common import HEARTBEAT_TOPIC, HEARTBEAT_INTERVAL, HANDSHAKE_REQUEST, HANDSHAKE_FLAG, TOPIC_FLAG
+from .serializer import Serializer, SERIALIZER_CLASSES, get_serializer, get_serializer_by_code
 
 
 class RpcServer:
-    """"""
+    """
+    If workers is 0, requests are executed one by one in server thread.
+    Otherwise a ROUTER socket is used for receiving requests, which are
+    executed concurrently by a pool of worker threads, and replies are
+    sent back once finished, possibly out of order.
 
-    def __init__(self) -> None:
+    Serializers are the names of serializers accepted for requests,
+    each request is replied with the serializer it is sent, and data
+    is published with publish serializer. Remove pickle from
+    serializers when server is exposed to untrusted network.
+
+    If batch interval (in seconds) is given, data published is buffered
+    by topic and sent in one message for each topic every interval by
+    server thread, which is unbatched by RpcClient transparently. Data
+    published with a key is conflated, only the latest data of the same
+    key in the buffer is sent (e.g. tick data keyed by vt_symbol).
+
+    Data is published as multipart message of topic frame and payload
+    frame, so that subscribers filter topic inside zmq. Subscriptions
+    are watched by XPUB socket, and while any subscriber of old version
+    exists, which receives all messages and can only read single frame,
+    data is published as single payload frame to all subscribers.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        serializers: list[str] | None = None,
+        publish_serializer: str = "pickle",
+        batch_interval: float = 0
+    ) -> None:
         """
         Constructor
         """
+        # Serializers related, accepted serializers are keyed by code.
+        # All serializers with dependency installed are accepted by default
+        self._serializers: dict[int, Serializer] = {}
+
+        if serializers is None:
+            serializers = []
+
+            for name in SERIALIZER_CLASSES.keys():
+                try:
+                    get_serializer(name)
+                except ImportError:
+                    continue
+                serializers.append(name)
+
+        for name in serializers:
+            serializer: Serializer = get_serializer(name)
+            self._serializers[serializer.code] = serializer
+
+        self._publish_serializer: Serializer = get_serializer(publish_serializer)
+
+        self._handshake: bytes = HANDSHAKE_FLAG + json.dumps({
+            "serializers": serializers,
+            "publish_serializer": publish_serializer
+        }).encode()
+
         # Save functions dict: key is function name, value is function object
         self._functions: dict[str, Callable] = {}
 
@@ -22,10 +79,36 @@ class RpcServer:
         self._context: zmq.Context = zmq.Context()
 
         # Reply socket (Request–reply pattern)
-        self._socket_rep: zmq.Socket = self._context.socket(zmq.REP)
+        self._workers: int = workers
+
+        if workers:
+            self._socket_rep: zmq.Socket = self._context.socket(zmq.ROUTER)
+        else:
+            self._socket_rep = self._context.socket(zmq.REP)
+
+        # Worker pool related, replies are passed back by inproc sockets
+        self._executor: ThreadPoolExecutor | None = None
+        self._result_address: str = f"inproc://rpc_result_{id(self)}"
+        self._socket_result: zmq.Socket = self._context.socket(zmq.PULL)
+        self._worker_local: threading.local = threading.local()
+        self._worker_sockets: list[zmq.Socket] = []
 
         # Publish socket (Publish–subscribe pattern)
-        self._socket_pub: zmq.Socket = self._context.socket(zmq.PUB)
+        self._socket_pub: zmq.Socket = self._context.socket(zmq.XPUB)
+
+        # Subscription related, single byte subscriptions of serializer
+        # codes are made by RpcClient for receiving data published by
+        # server of old version, which are not subscribers of old version
+        self._subscriptions: set[bytes] = set()
+        self._legacy_subscribed: bool = False
+        self._fallback_prefixes: set[bytes] = {bytes([cls.code]) for cls in SERIALIZER_CLASSES.values()}
+
+        # Batch publish related, data buffered is keyed by conflation key,
+        # or by sequence number if no key given
+        self._batch_interval: float = batch_interval
+        self._batches: dict[str, dict[Hashable, Any]] = {}
+        self._batch_count: int = 0
+        self._flush_at: float = 0
 
         # Worker thread related
         self._active: bool = False                          # RpcServer status
@@ -54,6 +137,11 @@ class RpcServer:
         self._socket_rep.bind(rep_address)
         self._socket_pub.bind(pub_address)
 
+        # Start worker pool
+        if self._workers:
+            self._socket_result.bind(self._result_address)
+            self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="RpcWorker")
+
         # Start RpcServer status
         self._active = True
 
@@ -84,41 +172,230 @@ class RpcServer:
         """
         Run RpcServer functions
         """
+        poller: zmq.Poller = zmq.Poller()
+        poller.register(self._socket_rep, zmq.POLLIN)
+
+        if self._executor:
+            poller.register(self._socket_result, zmq.POLLIN)
+
+        # Poll for 1 second, or batch interval in batch mode
+        timeout: int = 1000
+        if self._batch_interval:
+            timeout = max(int(self._batch_interval * 1000), 1)
+
         while self._active:
-            # Poll response socket for 1 second
-            n: int = self._socket_rep.poll(1000)
+            events: dict = dict(poller.poll(timeout))
             self.check_heartbeat()
 
-            if not n:
-                continue
+            with self._lock:
+                self.process_subscriptions()
+
+            if self._batch_interval:
+                self.check_flush()
 
             # Receive request data from Reply socket
-            req = self._socket_rep.recv_pyobj()
+            if self._socket_rep in events:
+                frames: list[bytes] = self._socket_rep.recv_multipart()
+
+                if self._executor:
+                    self._executor.submit(self.process_request_async, frames)
+                else:
+                    self._socket_rep.send_multipart(self.process_request(frames))
+
+            # Send response finished by worker threads
+            if self._socket_result in events:
+                self._socket_rep.send_multipart(self._socket_result.recv_multipart())
 
-            # Get function name and parameters
-            name, args, kwargs = req
+        # Wait for running requests to finish
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
 
-            # Try to get and execute callable function object; capture exception information if it fails
-            try:
-                func: Callable = self._functions[name]
-                r: object = func(*args, **kwargs)
-                rep: list = [True, r]
-            except Exception as e:  # noqa
-                rep = [False, traceback.format_exc()]
+            for socket in self._worker_sockets:
+                socket.close()
+            self._worker_sockets.clear()
 
-            # send callable response by Reply socket
-            self._socket_rep.send_pyobj(rep)
+            self._socket_result.unbind(self._result_address)
+
+        # Send data left in buffer
+        if self._batch_interval:
+            self.flush()
 
         # Unbind socket address
         self._socket_pub.unbind(str(self._socket_pub.LAST_ENDPOINT))
         self._socket_rep.unbind(str(self._socket_rep.LAST_ENDPOINT))
 
-    def publish(self, topic: str, data: object) -> None:
+    def process_request(self, frames: list[bytes]) -> list[bytes]:
+        """
+        Execute request and return response frames. Last frame is the
+        request data, and frames before it (routing envelope) are sent
+        back together with response.
+
+        Response is always returned, so that invalid request can not
+        stop server thread or leave REP socket waiting to reply.
+        """
+        try:
+            reply: bytes = self.execute_request(frames[-1])
+        except Exception:
+            reply = get_serializer("pickle").dumps([False, traceback.format_exc()])
+
+        return frames[:-1] + [reply]
+
+    def execute_request(self, data: bytes) -> bytes:
+        """
+        Execute request data and return response data.
+        """
+        # Reply accepted serializers for handshake
+        if data == HANDSHAKE_REQUEST:
+            return self._handshake
+
+        # Reject request of serializer not accepted, reply data is never
+        # loaded by server, so it is safe to dump with the same serializer,
+        # or with pickle if it is not available
+        serializer: Serializer | None = self._serializers.get(data[0], None) if data else None
+        if not serializer:
+            code: int | None = data[0] if data else None
+            rep: list = [False, f"Serializer of code {code} is not accepted by server"]
+
+            rejected: Serializer | None = None
+            if code is not None:
+                rejected = get_serializer_by_code(code)
+
+            return (rejected or get_serializer("pickle")).dumps(rep)
+
+        # Try to get function name and parameters, execute callable function object;
+        # capture exception information if it fails
+        try:
+            name, args, kwargs = serializer.loads(data)
+            func: Callable = self._functions[name]
+            r: object = func(*args, **kwargs)
+            rep = [True, r]
+        except Exception as e:  # noqa
+            rep = [False, traceback.format_exc()]
+
+        try:
+            reply: bytes = serializer.dumps(rep)
+        except Exception:
+            reply = serializer.dumps([False, traceback.format_exc()])
+
+        return reply
+
+    def process_request_async(self, frames: list[bytes]) -> None:
         """
-        Publish data
+        Execute request in worker thread and pass response back to
+        server thread, each worker thread has its own socket.
+        """
+        reply: list[bytes] = self.process_request(frames)
+
+        socket: zmq.Socket | None = getattr(self._worker_local, "socket", None)
+        if not socket:
+            socket = self._context.socket(zmq.PUSH)
+            socket.connect(self._result_address)
+
+            self._worker_local.socket = socket
+            with self._lock:
+                self._worker_sockets.append(socket)
+
+        socket.send_multipart(reply)
+
+    def publish(self, topic: str, data: object, key: Hashable | None = None) -> None:
+        """
+        Publish data, key is used for conflation in batch mode.
+        """
+        if self._batch_interval:
+            with self._lock:
+                batch: dict[Hashable, Any] | None = self._batches.get(topic, None)
+                if batch is None:
+                    batch = self._batches[topic] = {}
+
+                # Key is wrapped to not collide with sequence number, and
+                # conflated data is moved to the end to keep publish order
+                if key is None:
+                    self._batch_count += 1
+                    key = self._batch_count
+                else:
+                    key = (key,)
+                    batch.pop(key, None)
+
+                batch[key] = data
+            return
+
+        message: bytes = self._publish_serializer.dumps([topic, data])
+
+        with self._lock:
+            self.send_message(topic, message)
+
+    def check_flush(self) -> None:
+        """
+        Check whether it is required to send buffered data.
+        """
+        now: float = time()
+
+        if now >= self._flush_at:
+            self.flush()
+            self._flush_at = now + self._batch_interval
+
+    def flush(self) -> None:
+        """
+        Send data buffered in one message for each topic, a flag is
+        appended to the message for client to unbatch.
+
+        Subscriber of old version cannot unbatch, so while any of them
+        exists, data is sent one by one in messages without flag.
         """
         with self._lock:
-            self._socket_pub.send_pyobj([topic, data])
+            batches: dict[str, dict[Hashable, Any]] = self._batches
+            self._batches = {}
+
+        for topic, batch in batches.items():
+            with self._lock:
+                self.process_subscriptions()
+
+                if self._legacy_subscribed:
+                    for data in batch.values():
+                        self._socket_pub.send(self._publish_serializer.dumps([topic, data]))
+                else:
+                    message: bytes = self._publish_serializer.dumps([topic, list(batch.values()), True])
+                    self._socket_pub.send_multipart([TOPIC_FLAG + topic.encode(), message])
+
+    def send_message(self, topic: str, message: bytes) -> None:
+        """
+        Send message with topic frame, or without it if any subscriber
+        of old version exists. Should be called with lock acquired.
+        """
+        self.process_subscriptions()
+
+        if self._legacy_subscribed:
+            self._socket_pub.send(message)
+        else:
+            self._socket_pub.send_multipart([TOPIC_FLAG + topic.encode(), message])
+
+    def process_subscriptions(self) -> None:
+        """
+        Receive subscription changes from XPUB socket, which are made
+        effective by zmq when being checked here, so no message is sent
+        in wrong format. Should be called with lock acquired.
+        """
+        socket: zmq.Socket = self._socket_pub
+
+        if not socket.poll(0):
+            return
+
+        while socket.poll(0):
+            data: bytes = socket.recv()
+
+            # First byte is 1 for subscribe and 0 for unsubscribe
+            if data[0]:
+                self._subscriptions.add(data[1:])
+            else:
+                self._subscriptions.discard(data[1:])
+
+        self._legacy_subscribed = False
+
+        for prefix in self._subscriptions:
+            if prefix[:1] != TOPIC_FLAG and prefix not in self._fallback_prefixes:
+                self._legacy_subscribed = True
+                break
 
     def register(self, func: Callable) -> None:
         """
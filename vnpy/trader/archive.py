@@ -0,0 +1,121 @@
+"""
+On-disk archive of order and trade data evicted from memory.
+"""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+
+from .codec import ObjectCodec
+from .object import OrderData, TradeData
+
+
+class OmsArchive:
+    """
+    Store of orders and trades evicted from OmsEngine, backed by SQLite
+    with data objects encoded by ObjectCodec.
+
+    Archive only holds data of current session, existing data in file
+    is cleared when opened, and file is removed when closed.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """"""
+        # Extra of data is pickled, safe as archive only reads file written by itself
+        self.codec: ObjectCodec = ObjectCodec(allow_pickle=True)
+        self.lock: Lock = Lock()
+        self.file_path: Path = file_path
+
+        # Accessed by both event thread and other threads querying data
+        self.connection: sqlite3.Connection = sqlite3.connect(file_path, check_same_thread=False)
+
+        with self.lock, self.connection:
+            self.connection.execute("DROP TABLE IF EXISTS orders")
+            self.connection.execute("DROP TABLE IF EXISTS trades")
+            self.connection.execute("CREATE TABLE orders (vt_orderid TEXT PRIMARY KEY, data BLOB)")
+            self.connection.execute("CREATE TABLE trades (vt_tradeid TEXT PRIMARY KEY, vt_orderid TEXT, data BLOB)")
+            self.connection.execute("CREATE INDEX trades_vt_orderid ON trades (vt_orderid)")
+
+        self.order_count: int = 0
+        self.trade_count: int = 0
+
+    def save_orders(self, orders: list[OrderData]) -> None:
+        """
+        Save orders into archive, replacing existing data of the same vt_orderid.
+        """
+        rows: list[tuple[str, bytes]] = [(order.vt_orderid, self.codec.encode(order)) for order in orders]
+
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO orders VALUES (?, ?)", rows)
+
+        self.order_count += len(rows)
+
+    def save_trades(self, trades: list[TradeData]) -> None:
+        """
+        Save trades into archive, replacing existing data of the same vt_tradeid.
+        """
+        rows: list[tuple[str, str, bytes]] = [
+            (trade.vt_tradeid, trade.vt_orderid, self.codec.encode(trade)) for trade in trades
+        ]
+
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO trades VALUES (?, ?, ?)", rows)
+
+        self.trade_count += len(rows)
+
+    def load_order(self, vt_orderid: str) -> OrderData | None:
+        """
+        Load order by vt_orderid.
+        """
+        if not self.order_count:
+            return None
+
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT data FROM orders WHERE vt_orderid = ?", (vt_orderid,)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        order: OrderData = self.codec.decode(row[0])       # type: ignore
+        return order
+
+    def load_trade(self, vt_tradeid: str) -> TradeData | None:
+        """
+        Load trade by vt_tradeid.
+        """
+        if not self.trade_count:
+            return None
+
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT data FROM trades WHERE vt_tradeid = ?", (vt_tradeid,)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        trade: TradeData = self.codec.decode(row[0])       # type: ignore
+        return trade
+
+    def load_trades_by_order(self, vt_orderid: str) -> list[TradeData]:
+        """
+        Load trades of specific order.
+        """
+        if not self.trade_count:
+            return []
+
+        with self.lock:
+            rows: list[tuple] = self.connection.execute(
+                "SELECT data FROM trades WHERE vt_orderid = ?", (vt_orderid,)
+            ).fetchall()
+
+        return [self.codec.decode(row[0]) for row in rows]     # type: ignore
+
+    def close(self) -> None:
+        """"""
+        with self.lock:
+            self.connection.close()
+
+        self.file_path.unlink(missing_ok=True)
@@ -0,0 +1,530 @@
+"""
+Compact binary codec of trading data objects.
+"""
+
+import pickle
+import sys
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from operator import attrgetter
+from struct import Struct
+from types import UnionType
+from collections.abc import Callable
+from typing import Any, get_args
+from zoneinfo import ZoneInfo
+
+from vnpy.event import Event
+from vnpy.event.ring import RecordCodec
+
+from .constant import Exchange, Interval
+from .event import EVENT_TICK, EVENT_BAR
+from .object import (
+    TickData,
+    BarData,
+    SlotTickData,
+    SlotBarData,
+    OrderData,
+    TradeData,
+    PositionData,
+    AccountData,
+    LogData,
+    ContractData,
+    QuoteData,
+    SubscribeRequest,
+    OrderRequest,
+    CancelRequest,
+    HistoryRequest,
+    QuoteRequest,
+    TICK_FLOAT_FIELDS,
+    BAR_FLOAT_FIELDS,
+    VT_ID_CACHE_SIZE
+)
+
+
+# Record type codes
+RECORD_TICK: int = 1
+RECORD_BAR: int = 2
+
+# Placeholder for datetime field with None value
+NULL_TIME: int = -(2 ** 63)
+
+EPOCH: datetime = datetime(1970, 1, 1)
+
+# Max bytes of string fields in record
+GATEWAY_SIZE: int = 16
+SYMBOL_SIZE: int = 32
+EXCHANGE_SIZE: int = 16
+TZ_SIZE: int = 32
+NAME_SIZE: int = 64
+INTERVAL_SIZE: int = 8
+
+# Type code, gateway_name, symbol, exchange, timezone, datetime, localtime, name, float fields
+TICK_STRUCT: Struct = Struct(
+    f"<B{GATEWAY_SIZE}s{SYMBOL_SIZE}s{EXCHANGE_SIZE}s{TZ_SIZE}sqq{NAME_SIZE}s{len(TICK_FLOAT_FIELDS)}d"
+)
+
+# Type code, gateway_name, symbol, exchange, timezone, datetime, interval, float fields
+BAR_STRUCT: Struct = Struct(
+    f"<B{GATEWAY_SIZE}s{SYMBOL_SIZE}s{EXCHANGE_SIZE}s{TZ_SIZE}sq{INTERVAL_SIZE}s{len(BAR_FLOAT_FIELDS)}d"
+)
+
+EXCHANGES: dict[bytes, Exchange] = {e.value.encode(): e for e in Exchange}
+INTERVALS: dict[bytes, Interval] = {i.value.encode(): i for i in Interval}
+
+ZONES: dict[bytes, ZoneInfo] = {}
+
+# Classes supported by object codec, new class should only be appended
+# to keep type codes of existing classes unchanged
+OBJECT_CLASSES: list[type] = [
+    TickData,
+    BarData,
+    OrderData,
+    TradeData,
+    PositionData,
+    AccountData,
+    LogData,
+    ContractData,
+    QuoteData,
+    SubscribeRequest,
+    OrderRequest,
+    CancelRequest,
+    HistoryRequest,
+    QuoteRequest,
+    SlotTickData,
+    SlotBarData,
+]
+
+# Field kinds of object schema
+KIND_PLAIN: int = 0
+KIND_STR: int = 1
+KIND_ENUM: int = 2
+KIND_DATETIME: int = 3
+KIND_OPTIONAL: int = 4
+
+# Enum code for None value
+NULL_ENUM: int = 255
+
+# Cache of decoded strings
+STRINGS: dict[bytes, str] = {}
+
+
+def pack_datetime(dt: datetime | None) -> tuple[int, bytes]:
+    """
+    Convert datetime into wall clock microseconds and timezone name.
+    """
+    if dt is None:
+        return NULL_TIME, b""
+
+    tzinfo = dt.tzinfo
+    if tzinfo is None:
+        tz_name: bytes = b""
+    elif isinstance(tzinfo, ZoneInfo):
+        tz_name = tzinfo.key.encode()
+    else:
+        dt = dt.astimezone(timezone.utc)
+        tz_name = b"UTC"
+
+    delta: timedelta = dt.replace(tzinfo=None) - EPOCH
+    microseconds: int = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return microseconds, tz_name
+
+
+def unpack_datetime(microseconds: int, tz_name: bytes) -> datetime | None:
+    """
+    Convert wall clock microseconds and timezone name into datetime.
+    """
+    if microseconds == NULL_TIME:
+        return None
+
+    dt: datetime = EPOCH + timedelta(microseconds=microseconds)
+
+    tz_name = tz_name.rstrip(b"\x00")
+    if not tz_name:
+        return dt
+
+    tz: ZoneInfo | None = ZONES.get(tz_name, None)
+    if not tz:
+        tz = ZoneInfo(tz_name.decode())
+        ZONES[tz_name] = tz
+
+    return dt.replace(tzinfo=tz)
+
+
+def decode_str(data: bytes) -> str:
+    """
+    Decode null padded string.
+    """
+    return data.rstrip(b"\x00").decode()
+
+
+def check_sizes(*items: tuple[bytes, int]) -> bool:
+    """
+    Check that each string fits into its field of max size.
+    """
+    for data, size in items:
+        if len(data) > size:
+            return False
+
+    return True
+
+
+class MarketDataCodec(RecordCodec):
+    """
+    Codec of tick and bar data with fixed layout record, used for
+    fanning out market data through shared memory ring buffer.
+
+    Tick is published with EVENT_TICK and bar with EVENT_BAR, and
+    events of specific vt_symbol are also generated when decoded.
+
+    Data with string longer than its field is not encoded, instead of
+    being truncated into a different identifier.
+    """
+
+    record_size: int = max(TICK_STRUCT.size, BAR_STRUCT.size)
+
+    def encode(self, event: Event) -> bytes | None:
+        """"""
+        data: object = event.data
+
+        if isinstance(data, TickData):
+            return self.encode_tick(data)
+        elif isinstance(data, BarData):
+            return self.encode_bar(data)
+        else:
+            return None
+
+    def decode(self, data: bytes) -> list[Event]:
+        """"""
+        if data[0] == RECORD_TICK:
+            tick: TickData = self.decode_tick(data)
+            return [Event(EVENT_TICK, tick), Event(EVENT_TICK + tick.vt_symbol, tick)]
+        elif data[0] == RECORD_BAR:
+            bar: BarData = self.decode_bar(data)
+            return [Event(EVENT_BAR, bar), Event(EVENT_BAR + bar.vt_symbol, bar)]
+        else:
+            return []
+
+    def encode_tick(self, tick: TickData) -> bytes | None:
+        """"""
+        dt, tz_name = pack_datetime(tick.datetime)
+        localtime, _ = pack_datetime(tick.localtime)
+
+        gateway_name: bytes = tick.gateway_name.encode()
+        symbol: bytes = tick.symbol.encode()
+        exchange: bytes = tick.exchange.value.encode()
+        name: bytes = tick.name.encode()
+
+        if not check_sizes(
+            (gateway_name, GATEWAY_SIZE),
+            (symbol, SYMBOL_SIZE),
+            (exchange, EXCHANGE_SIZE),
+            (tz_name, TZ_SIZE),
+            (name, NAME_SIZE)
+        ):
+            return None
+
+        return TICK_STRUCT.pack(
+            RECORD_TICK,
+            gateway_name,
+            symbol,
+            exchange,
+            tz_name,
+            dt,
+            localtime,
+            name,
+            *[getattr(tick, name) for name in TICK_FLOAT_FIELDS]
+        )
+
+    def decode_tick(self, data: bytes) -> TickData:
+        """"""
+        values: tuple = TICK_STRUCT.unpack_from(data)
+        _, gateway_name, symbol, exchange, tz_name, dt, localtime, name = values[:8]
+
+        tick: TickData = TickData(
+            gateway_name=decode_str(gateway_name),
+            symbol=decode_str(symbol),
+            exchange=EXCHANGES[exchange.rstrip(b"\x00")],
+            datetime=unpack_datetime(dt, tz_name),        # type: ignore
+            name=decode_str(name),
+            localtime=unpack_datetime(localtime, b""),
+            **dict(zip(TICK_FLOAT_FIELDS, values[8:], strict=True))
+        )
+        return tick
+
+    def encode_bar(self, bar: BarData) -> bytes | None:
+        """"""
+        dt, tz_name = pack_datetime(bar.datetime)
+
+        if bar.interval:
+            interval: bytes = bar.interval.value.encode()
+        else:
+            interval = b""
+
+        gateway_name: bytes = bar.gateway_name.encode()
+        symbol: bytes = bar.symbol.encode()
+        exchange: bytes = bar.exchange.value.encode()
+
+        if not check_sizes(
+            (gateway_name, GATEWAY_SIZE),
+            (symbol, SYMBOL_SIZE),
+            (exchange, EXCHANGE_SIZE),
+            (tz_name, TZ_SIZE),
+            (interval, INTERVAL_SIZE)
+        ):
+            return None
+
+        return BAR_STRUCT.pack(
+            RECORD_BAR,
+            gateway_name,
+            symbol,
+            exchange,
+            tz_name,
+            dt,
+            interval,
+            *[getattr(bar, name) for name in BAR_FLOAT_FIELDS]
+        )
+
+    def decode_bar(self, data: bytes) -> BarData:
+        """"""
+        values: tuple = BAR_STRUCT.unpack_from(data)
+        _, gateway_name, symbol, exchange, tz_name, dt, interval = values[:7]
+
+        bar: BarData = BarData(
+            gateway_name=decode_str(gateway_name),
+            symbol=decode_str(symbol),
+            exchange=EXCHANGES[exchange.rstrip(b"\x00")],
+            datetime=unpack_datetime(dt, tz_name),        # type: ignore
+            interval=INTERVALS.get(interval.rstrip(b"\x00"), None),
+            **dict(zip(BAR_FLOAT_FIELDS, values[7:], strict=True))
+        )
+        return bar
+
+
+def decode_cached(data: bytes) -> str:
+    """
+    Decode string with cache, the same interned string object is
+    returned for the same data (e.g. symbol and gateway_name).
+    """
+    try:
+        return STRINGS[data]
+    except KeyError:
+        if len(STRINGS) >= VT_ID_CACHE_SIZE:
+            STRINGS.clear()
+
+        text: str = sys.intern(data.decode())
+        STRINGS[data] = text
+        return text
+
+
+class ObjectSchema:
+    """
+    Binary layout of a data object class, generated from its init fields.
+
+    Record starts with a fixed struct: type code, null flags of optional
+    fields, enum codes, datetime and length of strings, followed by
+    float/int/bool fields. Bytes of strings are appended after the struct.
+    Identifiers like vt_symbol are generated again when decoded.
+
+    Extra dict is pickled only if pickle is allowed, otherwise object
+    with extra cannot be encoded, and data with extra is rejected.
+    """
+
+    def __init__(self, code: int, cls: type, allow_pickle: bool = False) -> None:
+        """"""
+        self.code: int = code
+        self.cls: type = cls
+        self.allow_pickle: bool = allow_pickle
+
+        # Fields need to be converted: name, kind, optional, enum members
+        self.fields: list[tuple[str, int, bool, Any]] = []
+        self.enum_codes: dict[Enum, int] = {}
+
+        plain_names: list[str] = []
+        plain_format: str = ""
+        special_format: str = ""
+
+        for f in fields(cls):
+            if not f.init:
+                continue
+
+            tp: Any = f.type
+            optional: bool = False
+
+            if isinstance(tp, UnionType):
+                tp = [t for t in get_args(tp) if t is not type(None)][0]
+                optional = True
+
+            if tp in {float, int, bool} and not optional:
+                plain_names.append(f.name)
+                plain_format += {float: "d", int: "q", bool: "?"}[tp]
+            elif tp is float:
+                self.fields.append((f.name, KIND_OPTIONAL, True, None))
+                special_format += "d"
+            elif tp is str:
+                self.fields.append((f.name, KIND_STR, optional, None))
+                special_format += "I"
+            elif tp is datetime:
+                self.fields.append((f.name, KIND_DATETIME, optional, None))
+                special_format += "qI"
+            elif issubclass(tp, Enum):
+                self.fields.append((f.name, KIND_ENUM, optional, list(tp)))
+                special_format += "B"
+
+                for i, e in enumerate(tp):
+                    self.enum_codes[e] = i
+            else:
+                raise TypeError(f"Unsupported field type {tp} of {cls.__name__}.{f.name}")
+
+        # Extra dict is pickled if provided and allowed
+        self.extra: bool = "extra" in {f.name for f in fields(cls)}
+        if self.extra:
+            special_format += "I"
+
+        # Getter returning tuple of plain field values
+        self.plain_names: list[str] = plain_names
+        self.plain_getter: Callable[[object], tuple]
+
+        if len(plain_names) >= 2:
+            self.plain_getter = attrgetter(*plain_names)
+        else:
+            self.plain_getter = lambda obj: tuple(getattr(obj, name) for name in plain_names)
+
+        self.struct: Struct = Struct("<BQ" + special_format + plain_format)
+
+    def encode(self, obj: object) -> bytes:
+        """"""
+        values: list = [self.code, 0]
+        strings: list[bytes] = []
+        null_mask: int = 0
+
+        for i, (name, kind, optional, _) in enumerate(self.fields):
+            value: Any = getattr(obj, name)
+
+            if value is None and optional:
+                null_mask |= 1 << i
+
+            if kind == KIND_STR:
+                data: bytes = value.encode() if value is not None else b""
+                strings.append(data)
+                values.append(len(data))
+            elif kind == KIND_ENUM:
+                values.append(self.enum_codes[value] if value is not None else NULL_ENUM)
+            elif kind == KIND_DATETIME:
+                microseconds, tz_name = pack_datetime(value)
+                strings.append(tz_name)
+                values.append(microseconds)
+                values.append(len(tz_name))
+            else:
+                values.append(value if value is not None else 0)
+
+        if self.extra:
+            extra: dict | None = obj.extra         # type: ignore
+
+            if extra is not None and not self.allow_pickle:
+                raise TypeError(f"Extra of {self.cls.__name__} cannot be encoded without pickle allowed")
+
+            data = pickle.dumps(extra) if extra is not None else b""
+            strings.append(data)
+            values.append(len(data))
+
+        values[1] = null_mask
+
+        return self.struct.pack(*values, *self.plain_getter(obj)) + b"".join(strings)
+
+    def decode(self, data: bytes) -> object:
+        """"""
+        values: tuple = self.struct.unpack_from(data)
+        null_mask: int = values[1]
+        offset: int = self.struct.size
+        n: int = 2
+
+        kwargs: dict[str, Any] = {}
+
+        for name, kind, _, members in self.fields:
+            value: Any = values[n]
+            n += 1
+
+            if kind == KIND_STR:
+                end: int = offset + value
+                value = decode_cached(data[offset:end])
+                offset = end
+            elif kind == KIND_ENUM:
+                value = members[value] if value != NULL_ENUM else None
+            elif kind == KIND_DATETIME:
+                end = offset + values[n]
+                value = unpack_datetime(value, data[offset:end])
+                offset = end
+                n += 1
+
+            kwargs[name] = value
+
+        extra: dict | None = None
+        if self.extra:
+            size: int = values[n]
+            n += 1
+
+            if size:
+                if not self.allow_pickle:
+                    raise ValueError(f"Extra of {self.cls.__name__} cannot be decoded without pickle allowed")
+
+                extra = pickle.loads(data[offset:offset + size])
+
+        kwargs.update(zip(self.plain_names, values[n:], strict=True))
+
+        if null_mask:
+            for i, (name, _, optional, _) in enumerate(self.fields):
+                if optional and null_mask & (1 << i):
+                    kwargs[name] = None
+
+        obj: Any = self.cls(**kwargs)
+        if extra is not None:
+            obj.extra = extra
+
+        return obj
+
+
+class ObjectCodec:
+    """
+    Schema-driven binary codec of data objects in vnpy.trader.object,
+    which is more compact and faster than pickle.
+
+    Enums are encoded as codes and strings decoded are interned, so it
+    can be used for RPC, recording and caching data objects.
+
+    Extra dict of data object is pickled, so pickle is not allowed by
+    default, and should only be allowed for data from trusted source
+    (e.g. local file written by the same program).
+    """
+
+    def __init__(self, allow_pickle: bool = False) -> None:
+        """"""
+        self.schemas: list[ObjectSchema] = []
+        self.class_schemas: dict[type, ObjectSchema] = {}
+
+        for code, cls in enumerate(OBJECT_CLASSES):
+            schema: ObjectSchema = ObjectSchema(code, cls, allow_pickle)
+            self.schemas.append(schema)
+            self.class_schemas[cls] = schema
+
+    def is_supported(self, obj: object) -> bool:
+        """
+        Check if the object can be encoded.
+        """
+        return type(obj) in self.class_schemas
+
+    def encode(self, obj: object) -> bytes:
+        """
+        Encode data object into bytes.
+        """
+        schema: ObjectSchema | None = self.class_schemas.get(type(obj), None)
+        if not schema:
+            raise TypeError(f"Unsupported object type {type(obj).__name__}")
+
+        return schema.encode(obj)
+
+    def decode(self, data: bytes) -> object:
+        """
+        Decode bytes into data object.
+        """
+        return self.schemas[data[0]].decode(data)
@@ -1,12 +1,15 @@
 from copy import copy
+from math import isclose
 from typing import TYPE_CHECKING
 
 from .object import (
     ContractData,
+    ContractMeta,
     OrderData,
     TradeData,
     PositionData,
-    OrderRequest
+    OrderRequest,
+    CLOSE_YD_EXCHANGES
 )
 from .constant import Direction, Offset, Exchange
 
@@ -15,15 +18,36 @@ if TYPE_CHECKING:
 
 
 class PositionHolding:
-    """"""
-
-    def __init__(self, contract: ContractData) -> None:
+    """
+    Frozen volumes are maintained incrementally with the remaining volume
+    of each active close order, so updating order does not need to scan
+    all active orders. If verify is True, the result is checked against
+    a full recalculation after each order update.
+    """
+
+    def __init__(self, contract: ContractData, verify: bool = False) -> None:
         """"""
         self.vt_symbol: str = contract.vt_symbol
         self.exchange: Exchange = contract.exchange
+        self.close_yd: bool = contract.exchange in CLOSE_YD_EXCHANGES
+        self.verify: bool = verify
 
         self.active_orders: dict[str, OrderData] = {}
 
+        # Frozen volume of each active close order: direction, offset, volume
+        self.order_frozens: dict[str, tuple[Direction, Offset, float]] = {}
+
+        # Total frozen volume of active close orders by direction and offset
+        self.frozen_sums: dict[tuple[Direction, Offset], float] = {
+            (direction, offset): 0
+            for direction in (Direction.LONG, Direction.SHORT)
+            for offset in (Offset.CLOSE, Offset.CLOSETODAY, Offset.CLOSEYESTERDAY)
+        }
+
+        # Number of active close orders by direction and offset, total is
+        # reset to 0 when no order left to avoid float error accumulated
+        self.frozen_counts: dict[tuple[Direction, Offset], int] = dict.fromkeys(self.frozen_sums, 0)
+
         self.long_pos: float = 0
         self.long_yd: float = 0
         self.long_td: float = 0
@@ -53,13 +77,37 @@ class PositionHolding:
 
     def update_order(self, order: OrderData) -> None:
         """"""
+        vt_orderid: str = order.vt_orderid
+
+        # Remove frozen volume of previous order data
+        previous: tuple[Direction, Offset, float] | None = self.order_frozens.pop(vt_orderid, None)
+        if previous:
+            direction, offset, frozen = previous
+            key: tuple[Direction, Offset] = (direction, offset)
+
+            self.frozen_counts[key] -= 1
+            if self.frozen_counts[key]:
+                self.frozen_sums[key] -= frozen
+            else:
+                self.frozen_sums[key] = 0
+
         if order.is_active():
-            self.active_orders[order.vt_orderid] = order
+            self.active_orders[vt_orderid] = order
+
+            key = (order.direction, order.offset)      # type: ignore
+            if key in self.frozen_sums:
+                frozen = order.volume - order.traded
+                self.frozen_sums[key] += frozen
+                self.frozen_counts[key] += 1
+                self.order_frozens[vt_orderid] = (order.direction, order.offset, frozen)     # type: ignore
         else:
-            if order.vt_orderid in self.active_orders:
-                self.active_orders.pop(order.vt_orderid)
+            if vt_orderid in self.active_orders:
+                self.active_orders.pop(vt_orderid)
 
-        self.calculate_frozen()
+        self.apply_frozen_sums()
+
+        if self.verify:
+            self.verify_frozen()
 
     def update_order_request(self, req: OrderRequest, vt_orderid: str) -> None:
         """"""
@@ -78,7 +126,7 @@ class PositionHolding:
             elif trade.offset == Offset.CLOSEYESTERDAY:
                 self.short_yd -= trade.volume
             elif trade.offset == Offset.CLOSE:
-                if trade.exchange in {Exchange.SHFE, Exchange.INE}:
+                if self.close_yd:
                     self.short_yd -= trade.volume
                 else:
                     self.short_td -= trade.volume
@@ -94,7 +142,7 @@ class PositionHolding:
             elif trade.offset == Offset.CLOSEYESTERDAY:
                 self.long_yd -= trade.volume
             elif trade.offset == Offset.CLOSE:
-                if trade.exchange in {Exchange.SHFE, Exchange.INE}:
+                if self.close_yd:
                     self.long_yd -= trade.volume
                 else:
                     self.long_td -= trade.volume
@@ -109,49 +157,83 @@ class PositionHolding:
         # Update frozen volume to ensure no more than total volume
         self.sum_pos_frozen()
 
+    def apply_frozen_sums(self) -> None:
+        """
+        Calculate frozen volumes from total frozen volume of active close
+        orders. Close orders freeze today position first, and the part
+        exceeding today position freezes yesterday position.
+        """
+        sums: dict[tuple[Direction, Offset], float] = self.frozen_sums
+
+        # Short position is frozen by long close orders
+        close_frozen: float = sums[(Direction.LONG, Offset.CLOSE)]
+        self.short_td_frozen = sums[(Direction.LONG, Offset.CLOSETODAY)] + close_frozen
+        self.short_yd_frozen = sums[(Direction.LONG, Offset.CLOSEYESTERDAY)]
+
+        if close_frozen and self.short_td_frozen > self.short_td:
+            self.short_yd_frozen += self.short_td_frozen - self.short_td
+            self.short_td_frozen = self.short_td
+
+        # Long position is frozen by short close orders
+        close_frozen = sums[(Direction.SHORT, Offset.CLOSE)]
+        self.long_td_frozen = sums[(Direction.SHORT, Offset.CLOSETODAY)] + close_frozen
+        self.long_yd_frozen = sums[(Direction.SHORT, Offset.CLOSEYESTERDAY)]
+
+        if close_frozen and self.long_td_frozen > self.long_td:
+            self.long_yd_frozen += self.long_td_frozen - self.long_td
+            self.long_td_frozen = self.long_td
+
+        self.sum_pos_frozen()
+
     def calculate_frozen(self) -> None:
-        """"""
-        self.long_pos_frozen = 0
-        self.long_yd_frozen = 0
-        self.long_td_frozen = 0
+        """
+        Recalculate frozen volumes by scanning all active orders.
+        """
+        self.order_frozens.clear()
 
-        self.short_pos_frozen = 0
-        self.short_yd_frozen = 0
-        self.short_td_frozen = 0
+        for key in self.frozen_sums.keys():
+            self.frozen_sums[key] = 0
+            self.frozen_counts[key] = 0
 
         for order in self.active_orders.values():
+            key = (order.direction, order.offset)       # type: ignore
+
             # Ignore position open orders
-            if order.offset == Offset.OPEN:
+            if key not in self.frozen_sums:
                 continue
 
             frozen: float = order.volume - order.traded
+            self.frozen_sums[key] += frozen
+            self.frozen_counts[key] += 1
+            self.order_frozens[order.vt_orderid] = (order.direction, order.offset, frozen)      # type: ignore
 
-            if order.direction == Direction.LONG:
-                if order.offset == Offset.CLOSETODAY:
-                    self.short_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.short_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.short_td_frozen += frozen
-
-                    if self.short_td_frozen > self.short_td:
-                        self.short_yd_frozen += (self.short_td_frozen
-                                                 - self.short_td)
-                        self.short_td_frozen = self.short_td
-            elif order.direction == Direction.SHORT:
-                if order.offset == Offset.CLOSETODAY:
-                    self.long_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.long_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.long_td_frozen += frozen
-
-                    if self.long_td_frozen > self.long_td:
-                        self.long_yd_frozen += (self.long_td_frozen
-                                                - self.long_td)
-                        self.long_td_frozen = self.long_td
+        self.apply_frozen_sums()
 
-        self.sum_pos_frozen()
+    def verify_frozen(self) -> None:
+        """
+        Check frozen volumes maintained incrementally against full
+        recalculation, and raise error if not matched. Volumes are
+        compared with tolerance of float error.
+        """
+        frozens: tuple[float, ...] = self.get_frozens()
+        values: tuple[float, ...] = frozens + tuple(self.frozen_sums.values())
+
+        self.calculate_frozen()
+
+        recalculated: tuple[float, ...] = self.get_frozens() + tuple(self.frozen_sums.values())
+        matched: bool = all(isclose(a, b, abs_tol=1e-9) for a, b in zip(values, recalculated, strict=True))
+
+        if not matched:
+            raise RuntimeError(
+                f"Frozen volume of {self.vt_symbol} not matched, "
+                f"incremental {frozens}, recalculated {self.get_frozens()}"
+            )
+
+    def get_frozens(self) -> tuple[float, ...]:
+        """
+        Get frozen volumes of today and yesterday position.
+        """
+        return (self.long_td_frozen, self.long_yd_frozen, self.short_td_frozen, self.short_yd_frozen)
 
     def sum_pos_frozen(self) -> None:
         """"""
@@ -165,6 +247,39 @@ class PositionHolding:
         self.long_pos_frozen = self.long_td_frozen + self.long_yd_frozen
         self.short_pos_frozen = self.short_td_frozen + self.short_yd_frozen
 
+    def get_snapshot(self) -> "PositionHolding":
+        """
+        Get a copy of holding for converting requests, which can be
+        frozen by requests without affecting the original one.
+        """
+        snapshot: PositionHolding = copy(self)
+        snapshot.frozen_sums = dict(self.frozen_sums)
+        snapshot.frozen_counts = dict(self.frozen_counts)
+        return snapshot
+
+    def freeze_requests(self, reqs: list[OrderRequest]) -> None:
+        """
+        Add volume of close requests into frozen volumes, as if they
+        were sent as active orders.
+        """
+        for req in reqs:
+            key: tuple[Direction, Offset] = (req.direction, req.offset)
+            if key in self.frozen_sums:
+                self.frozen_sums[key] += req.volume
+
+        self.apply_frozen_sums()
+
+    def convert_order_request(self, req: OrderRequest, lock: bool, net: bool = False) -> list[OrderRequest]:
+        """"""
+        if lock:
+            return self.convert_order_request_lock(req)
+        elif net:
+            return self.convert_order_request_net(req)
+        elif self.close_yd:
+            return self.convert_order_request_shfe(req)
+        else:
+            return [req]
+
     def convert_order_request_shfe(self, req: OrderRequest) -> list[OrderRequest]:
         """"""
         if req.offset == Offset.OPEN:
@@ -208,10 +323,8 @@ class PositionHolding:
             td_volume = self.long_td
             yd_available = self.long_yd - self.long_yd_frozen
 
-        close_yd_exchanges: set[Exchange] = {Exchange.SHFE, Exchange.INE}
-
         # If there is td_volume, we can only lock position
-        if td_volume and self.exchange not in close_yd_exchanges:
+        if td_volume and not self.close_yd:
             req_open: OrderRequest = copy(req)
             req_open.offset = Offset.OPEN
             return [req_open]
@@ -224,7 +337,7 @@ class PositionHolding:
 
             if yd_available:
                 req_yd: OrderRequest = copy(req)
-                if self.exchange in close_yd_exchanges:
+                if self.close_yd:
                     req_yd.offset = Offset.CLOSEYESTERDAY
                 else:
                     req_yd.offset = Offset.CLOSE
@@ -251,7 +364,7 @@ class PositionHolding:
             yd_available = self.long_yd - self.long_yd_frozen
 
         # Split close order to close today/yesterday for SHFE/INE exchange
-        if req.exchange in {Exchange.SHFE, Exchange.INE}:
+        if self.close_yd:
             reqs: list[OrderRequest] = []
             volume_left: float = req.volume
 
@@ -310,11 +423,16 @@ class PositionHolding:
 class OffsetConverter:
     """"""
 
-    def __init__(self, oms_engine: "OmsEngine") -> None:
-        """"""
+    def __init__(self, oms_engine: "OmsEngine", verify: bool = False) -> None:
+        """
+        If verify is True, frozen volumes of position holdings are
+        checked against full recalculation after each order update.
+        """
         self.holdings: dict[str, PositionHolding] = {}
+        self.verify: bool = verify
 
         self.get_contract = oms_engine.get_contract
+        self.get_contract_meta = oms_engine.get_contract_meta
 
     def update_position(self, position: PositionData) -> None:
         """"""
@@ -359,7 +477,7 @@ class OffsetConverter:
         if not holding:
             contract: ContractData | None = self.get_contract(vt_symbol)
             if contract:
-                holding = PositionHolding(contract)
+                holding = PositionHolding(contract, self.verify)
                 self.holdings[vt_symbol] = holding
 
         return holding
@@ -378,25 +496,56 @@ class OffsetConverter:
 
         if not holding:
             return [req]
-        elif lock:
-            return holding.convert_order_request_lock(req)
-        elif net:
-            return holding.convert_order_request_net(req)
-        elif req.exchange in {Exchange.SHFE, Exchange.INE}:
-            return holding.convert_order_request_shfe(req)
         else:
-            return [req]
+            return holding.convert_order_request(req, lock, net)
+
+    def convert_order_requests(
+        self,
+        reqs: list[OrderRequest],
+        lock: bool,
+        net: bool = False
+    ) -> list[OrderRequest]:
+        """
+        Convert many requests at once. Requests of the same vt_symbol
+        are converted against one snapshot of position holding, with
+        volume closed by earlier requests taken as frozen.
+        """
+        snapshots: dict[str, PositionHolding | None] = {}
+        results: list[OrderRequest] = []
+
+        for req in reqs:
+            vt_symbol: str = req.vt_symbol
+
+            if vt_symbol in snapshots:
+                snapshot: PositionHolding | None = snapshots[vt_symbol]
+            else:
+                snapshot = None
+
+                if self.is_convert_required(vt_symbol):
+                    holding: PositionHolding | None = self.get_position_holding(vt_symbol)
+                    if holding:
+                        snapshot = holding.get_snapshot()
+
+                snapshots[vt_symbol] = snapshot
+
+            if not snapshot:
+                results.append(req)
+                continue
+
+            converted: list[OrderRequest] = snapshot.convert_order_request(req, lock, net)
+            snapshot.freeze_requests(converted)
+            results.extend(converted)
+
+        return results
 
     def is_convert_required(self, vt_symbol: str) -> bool:
         """
         Check if the contract needs offset convert.
         """
-        contract: ContractData | None = self.get_contract(vt_symbol)
+        meta: ContractMeta | None = self.get_contract_meta(vt_symbol)
 
         # Only contracts with long-short position mode requires convert
-        if not contract:
-            return False
-        elif contract.net_position:
+        if not meta:
             return False
         else:
-            return True
+            return meta.convert_required
@@ -2,13 +2,22 @@ import smtplib
 import os
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
 from email.message import EmailMessage
 from queue import Empty, Queue
-from threading import Thread
+from threading import Lock, Thread
+from itertools import islice
+from pathlib import Path
 from typing import TypeVar
 from collections.abc import Callable
 
-from vnpy.event import Event, EventEngine
+from vnpy.event import (
+    Event,
+    EventEngine,
+    HandlerAlert,
+    EVENT_HANDLER_ERROR,
+    EVENT_HANDLER_SLOW
+)
 from .app import BaseApp
 from .event import (
     EVENT_TICK,
@@ -21,6 +30,7 @@ from .event import (
     EVENT_QUOTE
 )
 from .gateway import BaseGateway
+from .constant import Direction
 from .object import (
     CancelRequest,
     LogData,
@@ -36,11 +46,13 @@ from .object import (
     PositionData,
     AccountData,
     ContractData,
+    ContractMeta,
     Exchange
 )
 from .setting import SETTINGS
-from .utility import TRADER_DIR
+from .utility import TRADER_DIR, get_file_path
 from .converter import OffsetConverter
+from .archive import OmsArchive
 from .logger import logger, DEBUG, INFO, WARNING, ERROR, CRITICAL
 from .locale import _
 
@@ -141,6 +153,7 @@ class MainEngine:
         self.get_account: Callable[[str], AccountData | None] = oms_engine.get_account
         self.get_contract: Callable[[str], ContractData | None] = oms_engine.get_contract
         self.get_quote: Callable[[str], QuoteData | None] = oms_engine.get_quote
+        self.get_contract_meta: Callable[[str], ContractMeta | None] = oms_engine.get_contract_meta
         self.get_all_ticks: Callable[[], list[TickData]] = oms_engine.get_all_ticks
         self.get_all_orders: Callable[[], list[OrderData]] = oms_engine.get_all_orders
         self.get_all_trades: Callable[[], list[TradeData]] = oms_engine.get_all_trades
@@ -150,8 +163,14 @@ class MainEngine:
         self.get_all_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_quotes
         self.get_all_active_orders: Callable[[], list[OrderData]] = oms_engine.get_all_active_orders
         self.get_all_active_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_active_quotes
+        self.get_active_orders_by_symbol: Callable[[str], list[OrderData]] = oms_engine.get_active_orders_by_symbol
+        self.get_active_orders_by_gateway: Callable[[str], list[OrderData]] = oms_engine.get_active_orders_by_gateway
+        self.get_active_orders_by_direction: Callable[[Direction | None], list[OrderData]] = oms_engine.get_active_orders_by_direction
+        self.get_positions_by_symbol: Callable[[str], list[PositionData]] = oms_engine.get_positions_by_symbol
+        self.get_trades_by_order: Callable[[str], list[TradeData]] = oms_engine.get_trades_by_order
         self.update_order_request: Callable[[OrderRequest, str, str], None] = oms_engine.update_order_request
         self.convert_order_request: Callable[[OrderRequest, str, bool, bool], list[OrderRequest]] = oms_engine.convert_order_request
+        self.convert_order_requests: Callable[[list[OrderRequest], str, bool, bool], list[OrderRequest]] = oms_engine.convert_order_requests
         self.get_converter: Callable[[str], OffsetConverter | None] = oms_engine.get_converter
 
         email_engine: EmailEngine = self.add_engine(EmailEngine)
@@ -308,6 +327,9 @@ class LogEngine(BaseEngine):
 
         self.register_log(EVENT_LOG)
 
+        self.event_engine.register(EVENT_HANDLER_ERROR, self.process_alert_event)
+        self.event_engine.register(EVENT_HANDLER_SLOW, self.process_alert_event)
+
     def process_log_event(self, event: Event) -> None:
         """Process log event"""
         if not self.active:
@@ -317,11 +339,99 @@ class LogEngine(BaseEngine):
         level: str | int = self.level_map.get(log.level, log.level)
         logger.log(level, log.msg, gateway_name=log.gateway_name)
 
+    def process_alert_event(self, event: Event) -> None:
+        """Process handler alert event of event engine"""
+        if not self.active:
+            return
+
+        alert: HandlerAlert = event.data
+
+        if event.type == EVENT_HANDLER_ERROR:
+            level: str = "ERROR"
+        else:
+            level = "WARNING"
+
+        logger.log(level, str(alert), gateway_name="EventEngine")
+
     def register_log(self, event_type: str) -> None:
         """Register log event handler"""
         self.event_engine.register(event_type, self.process_log_event)
 
 
+def add_index(index: dict, key: object, id: str, data: object) -> None:
+    """
+    Add data into bucket of secondary index.
+    """
+    bucket: dict | None = index.get(key, None)
+    if bucket is None:
+        bucket = {}
+        index[key] = bucket
+    bucket[id] = data
+
+
+def remove_index(index: dict, key: object, id: str) -> None:
+    """
+    Remove data from bucket of secondary index, and remove empty bucket.
+    """
+    bucket: dict | None = index.get(key, None)
+    if bucket is None:
+        return
+
+    bucket.pop(id, None)
+    if not bucket:
+        index.pop(key)
+
+
+class DataSnapshot:
+    """
+    Cached immutable snapshot of values in dict, which is only rebuilt
+    when the dict changed since last read.
+
+    Version is updated by the thread modifying the dict, and snapshot
+    can be safely read by other threads. Each reader gets a new list
+    copied from the snapshot tuple, which is faster than copying from
+    the dict and can be modified freely.
+    """
+
+    def __init__(self, data: dict) -> None:
+        """"""
+        self.data: dict = data
+        self.version: int = 0
+        self.lock: Lock = Lock()
+
+        # Version and values are replaced together
+        self.cache: tuple[int, tuple] = (-1, ())
+
+    def update_version(self) -> None:
+        """
+        Called after the dict is modified.
+        """
+        self.version += 1
+
+    def get_values(self) -> list:
+        """
+        Get list of values in dict.
+        """
+        version, values = self.cache
+        if version == self.version:
+            return list(values)
+
+        with self.lock:
+            version = self.version
+
+            # Retry if dict is modified by other thread while copying
+            while True:
+                try:
+                    values = tuple(self.data.values())
+                    break
+                except RuntimeError:
+                    pass
+
+            self.cache = (version, values)
+
+        return list(values)
+
+
 class OmsEngine(BaseEngine):
     """
     Provides order management system function.
@@ -342,8 +452,47 @@ class OmsEngine(BaseEngine):
         self.active_orders: dict[str, OrderData] = {}
         self.active_quotes: dict[str, QuoteData] = {}
 
+        # Precomputed fields of contracts for order routing
+        self.contract_metas: dict[str, ContractMeta] = {}
+
+        # Cached lists of data returned by get_all_* methods
+        self.tick_snapshot: DataSnapshot = DataSnapshot(self.ticks)
+        self.order_snapshot: DataSnapshot = DataSnapshot(self.orders)
+        self.trade_snapshot: DataSnapshot = DataSnapshot(self.trades)
+        self.position_snapshot: DataSnapshot = DataSnapshot(self.positions)
+        self.account_snapshot: DataSnapshot = DataSnapshot(self.accounts)
+        self.contract_snapshot: DataSnapshot = DataSnapshot(self.contracts)
+        self.quote_snapshot: DataSnapshot = DataSnapshot(self.quotes)
+        self.active_order_snapshot: DataSnapshot = DataSnapshot(self.active_orders)
+        self.active_quote_snapshot: DataSnapshot = DataSnapshot(self.active_quotes)
+
+        # Secondary indexes maintained with data update
+        self.symbol_active_orders: dict[str, dict[str, OrderData]] = {}
+        self.gateway_active_orders: dict[str, dict[str, OrderData]] = {}
+        self.direction_active_orders: dict[Direction | None, dict[str, OrderData]] = {}
+        self.symbol_positions: dict[str, dict[str, PositionData]] = {}
+        self.order_trades: dict[str, dict[str, TradeData]] = {}
+
         self.offset_converters: dict[str, OffsetConverter] = {}
 
+        # Max number of orders and trades kept in memory, 0 for unlimited.
+        # Inactive orders and old trades exceeding the limit are evicted
+        # into archive on disk, and still available by query methods.
+        self.max_orders: int = SETTINGS["oms.max_orders"]
+        self.max_trades: int = SETTINGS["oms.max_trades"]
+        self.archive: OmsArchive | None = None
+
+        # Orders in sequence of becoming inactive, as candidates of eviction,
+        # and orders in memory with trades archived, for skipping archive query
+        self.inactive_orderids: deque[str] = deque()
+        self.archived_trade_orderids: set[str] = set()
+
+        # Archive file is named with process id, as each process has
+        # its own archive of current session
+        if self.max_orders or self.max_trades:
+            file_path: Path = get_file_path(SETTINGS["oms.archive"])
+            self.archive = OmsArchive(file_path.with_stem(f"{file_path.stem}_{os.getpid()}"))
+
         self.register_event()
 
     def register_event(self) -> None:
@@ -360,38 +509,67 @@ class OmsEngine(BaseEngine):
         """"""
         tick: TickData = event.data
         self.ticks[tick.vt_symbol] = tick
+        self.tick_snapshot.update_version()
 
     def process_order_event(self, event: Event) -> None:
         """"""
         order: OrderData = event.data
+        new: bool = order.vt_orderid not in self.orders
+
         self.orders[order.vt_orderid] = order
+        self.order_snapshot.update_version()
 
         # If order is active, then update data in dict.
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
+            self.active_order_snapshot.update_version()
+            self.add_active_order_index(order)
         # Otherwise, pop inactive order from in dict
         elif order.vt_orderid in self.active_orders:
             self.active_orders.pop(order.vt_orderid)
+            self.active_order_snapshot.update_version()
+            self.remove_active_order_index(order)
+
+            if self.max_orders:
+                self.inactive_orderids.append(order.vt_orderid)
+        elif new and self.max_orders:
+            self.inactive_orderids.append(order.vt_orderid)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(order.gateway_name, None)
         if converter:
             converter.update_order(order)
 
+        # Wait until enough inactive orders for one batch of eviction,
+        # in case most orders are active
+        if (
+            self.max_orders
+            and len(self.orders) > self.max_orders
+            and len(self.inactive_orderids) >= max(self.max_orders // 10, 1)
+        ):
+            self.evict_orders()
+
     def process_trade_event(self, event: Event) -> None:
         """"""
         trade: TradeData = event.data
         self.trades[trade.vt_tradeid] = trade
+        self.trade_snapshot.update_version()
+        add_index(self.order_trades, trade.vt_orderid, trade.vt_tradeid, trade)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(trade.gateway_name, None)
         if converter:
             converter.update_trade(trade)
 
+        if self.max_trades and len(self.trades) > self.max_trades:
+            self.evict_trades()
+
     def process_position_event(self, event: Event) -> None:
         """"""
         position: PositionData = event.data
         self.positions[position.vt_positionid] = position
+        self.position_snapshot.update_version()
+        add_index(self.symbol_positions, position.vt_symbol, position.vt_positionid, position)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(position.gateway_name, None)
@@ -402,27 +580,101 @@ class OmsEngine(BaseEngine):
         """"""
         account: AccountData = event.data
         self.accounts[account.vt_accountid] = account
+        self.account_snapshot.update_version()
 
     def process_contract_event(self, event: Event) -> None:
         """"""
         contract: ContractData = event.data
         self.contracts[contract.vt_symbol] = contract
+        self.contract_metas[contract.vt_symbol] = ContractMeta.from_contract(contract)
+        self.contract_snapshot.update_version()
 
         # Initialize offset converter for each gateway
         if contract.gateway_name not in self.offset_converters:
-            self.offset_converters[contract.gateway_name] = OffsetConverter(self)
+            self.offset_converters[contract.gateway_name] = OffsetConverter(self, SETTINGS["oms.verify_frozen"])
 
     def process_quote_event(self, event: Event) -> None:
         """"""
         quote: QuoteData = event.data
         self.quotes[quote.vt_quoteid] = quote
+        self.quote_snapshot.update_version()
 
         # If quote is active, then update data in dict.
         if quote.is_active():
             self.active_quotes[quote.vt_quoteid] = quote
+            self.active_quote_snapshot.update_version()
         # Otherwise, pop inactive quote from in dict
         elif quote.vt_quoteid in self.active_quotes:
             self.active_quotes.pop(quote.vt_quoteid)
+            self.active_quote_snapshot.update_version()
+
+    def add_active_order_index(self, order: OrderData) -> None:
+        """
+        Add active order into secondary indexes.
+        """
+        vt_orderid: str = order.vt_orderid
+
+        add_index(self.symbol_active_orders, order.vt_symbol, vt_orderid, order)
+        add_index(self.gateway_active_orders, order.gateway_name, vt_orderid, order)
+        add_index(self.direction_active_orders, order.direction, vt_orderid, order)
+
+    def remove_active_order_index(self, order: OrderData) -> None:
+        """
+        Remove inactive order from secondary indexes.
+        """
+        vt_orderid: str = order.vt_orderid
+
+        remove_index(self.symbol_active_orders, order.vt_symbol, vt_orderid)
+        remove_index(self.gateway_active_orders, order.gateway_name, vt_orderid)
+        remove_index(self.direction_active_orders, order.direction, vt_orderid)
+
+    def evict_orders(self) -> None:
+        """
+        Evict orders inactive for longest time into archive, a tenth of
+        max orders are evicted at once to reduce number of writes.
+        """
+        if not self.archive:
+            return
+
+        count: int = len(self.orders) - self.max_orders + self.max_orders // 10
+        orders: list[OrderData] = []
+
+        while self.inactive_orderids and len(orders) < count:
+            vt_orderid: str = self.inactive_orderids.popleft()
+
+            # Skip order already evicted or active again
+            order: OrderData | None = self.orders.get(vt_orderid, None)
+            if order and vt_orderid not in self.active_orders:
+                orders.append(order)
+
+        self.archive.save_orders(orders)
+
+        # Trades of order evicted are always queried from archive
+        for order in orders:
+            self.orders.pop(order.vt_orderid)
+            self.archived_trade_orderids.discard(order.vt_orderid)
+        self.order_snapshot.update_version()
+
+    def evict_trades(self) -> None:
+        """
+        Evict oldest trades into archive, a tenth of max trades are
+        evicted at once to reduce number of writes.
+        """
+        if not self.archive:
+            return
+
+        count: int = len(self.trades) - self.max_trades + self.max_trades // 10
+        trades: list[TradeData] = list(islice(self.trades.values(), count))
+
+        self.archive.save_trades(trades)
+
+        for trade in trades:
+            self.trades.pop(trade.vt_tradeid)
+            remove_index(self.order_trades, trade.vt_orderid, trade.vt_tradeid)
+
+            if trade.vt_orderid in self.orders:
+                self.archived_trade_orderids.add(trade.vt_orderid)
+        self.trade_snapshot.update_version()
 
     def get_tick(self, vt_symbol: str) -> TickData | None:
         """
@@ -434,13 +686,23 @@ class OmsEngine(BaseEngine):
         """
         Get latest order data by vt_orderid.
         """
-        return self.orders.get(vt_orderid, None)
+        order: OrderData | None = self.orders.get(vt_orderid, None)
+
+        if not order and self.archive:
+            order = self.archive.load_order(vt_orderid)
+
+        return order
 
     def get_trade(self, vt_tradeid: str) -> TradeData | None:
         """
         Get trade data by vt_tradeid.
         """
-        return self.trades.get(vt_tradeid, None)
+        trade: TradeData | None = self.trades.get(vt_tradeid, None)
+
+        if not trade and self.archive:
+            trade = self.archive.load_trade(vt_tradeid)
+
+        return trade
 
     def get_position(self, vt_positionid: str) -> PositionData | None:
         """
@@ -460,6 +722,12 @@ class OmsEngine(BaseEngine):
         """
         return self.contracts.get(vt_symbol, None)
 
+    def get_contract_meta(self, vt_symbol: str) -> ContractMeta | None:
+        """
+        Get contract meta by vt_symbol.
+        """
+        return self.contract_metas.get(vt_symbol, None)
+
     def get_quote(self, vt_quoteid: str) -> QuoteData | None:
         """
         Get latest quote data by vt_orderid.
@@ -470,55 +738,92 @@ class OmsEngine(BaseEngine):
         """
         Get all tick data.
         """
-        return list(self.ticks.values())
+        return self.tick_snapshot.get_values()
 
     def get_all_orders(self) -> list[OrderData]:
         """
         Get all order data.
         """
-        return list(self.orders.values())
+        return self.order_snapshot.get_values()
 
     def get_all_trades(self) -> list[TradeData]:
         """
         Get all trade data.
         """
-        return list(self.trades.values())
+        return self.trade_snapshot.get_values()
 
     def get_all_positions(self) -> list[PositionData]:
         """
         Get all position data.
         """
-        return list(self.positions.values())
+        return self.position_snapshot.get_values()
 
     def get_all_accounts(self) -> list[AccountData]:
         """
         Get all account data.
         """
-        return list(self.accounts.values())
+        return self.account_snapshot.get_values()
 
     def get_all_contracts(self) -> list[ContractData]:
         """
         Get all contract data.
         """
-        return list(self.contracts.values())
+        return self.contract_snapshot.get_values()
 
     def get_all_quotes(self) -> list[QuoteData]:
         """
         Get all quote data.
         """
-        return list(self.quotes.values())
+        return self.quote_snapshot.get_values()
 
     def get_all_active_orders(self) -> list[OrderData]:
         """
         Get all active orders.
         """
-        return list(self.active_orders.values())
+        return self.active_order_snapshot.get_values()
 
     def get_all_active_quotes(self) -> list[QuoteData]:
         """
         Get all active quotes.
         """
-        return list(self.active_quotes.values())
+        return self.active_quote_snapshot.get_values()
+
+    def get_active_orders_by_symbol(self, vt_symbol: str) -> list[OrderData]:
+        """
+        Get active orders of specific vt_symbol.
+        """
+        return list(self.symbol_active_orders.get(vt_symbol, {}).values())
+
+    def get_active_orders_by_gateway(self, gateway_name: str) -> list[OrderData]:
+        """
+        Get active orders of specific gateway.
+        """
+        return list(self.gateway_active_orders.get(gateway_name, {}).values())
+
+    def get_active_orders_by_direction(self, direction: Direction | None) -> list[OrderData]:
+        """
+        Get active orders of specific direction.
+        """
+        return list(self.direction_active_orders.get(direction, {}).values())
+
+    def get_positions_by_symbol(self, vt_symbol: str) -> list[PositionData]:
+        """
+        Get positions of specific vt_symbol.
+        """
+        return list(self.symbol_positions.get(vt_symbol, {}).values())
+
+    def get_trades_by_order(self, vt_orderid: str) -> list[TradeData]:
+        """
+        Get trades of specific order.
+        """
+        trades: dict[str, TradeData] = self.order_trades.get(vt_orderid, {})
+
+        # Archive is only queried for order with trades archived, or order evicted
+        if self.archive and (vt_orderid in self.archived_trade_orderids or vt_orderid not in self.orders):
+            archived: dict[str, TradeData] = {t.vt_tradeid: t for t in self.archive.load_trades_by_order(vt_orderid)}
+            trades = archived | trades
+
+        return list(trades.values())
 
     def update_order_request(self, req: OrderRequest, vt_orderid: str, gateway_name: str) -> None:
         """
@@ -545,12 +850,33 @@ class OmsEngine(BaseEngine):
         reqs: list[OrderRequest] = converter.convert_order_request(req, lock, net)
         return reqs
 
+    def convert_order_requests(
+        self,
+        reqs: list[OrderRequest],
+        gateway_name: str,
+        lock: bool,
+        net: bool = False
+    ) -> list[OrderRequest]:
+        """
+        Convert many order requests at once according to given mode.
+        """
+        converter: OffsetConverter | None = self.offset_converters.get(gateway_name, None)
+        if not converter:
+            return list(reqs)
+
+        return converter.convert_order_requests(reqs, lock, net)
+
     def get_converter(self, gateway_name: str) -> OffsetConverter | None:
         """
         Get offset converter object of specific gateway.
         """
         return self.offset_converters.get(gateway_name, None)
 
+    def close(self) -> None:
+        """"""
+        if self.archive:
+            self.archive.close()
+
 
 class EmailEngine(BaseEngine):
     """
@@ -11,4 +11,5 @@ EVENT_POSITION = "ePosition."
 EVENT_ACCOUNT = "eAccount."
 EVENT_QUOTE = "eQuote."
 EVENT_CONTRACT = "eContract."
+EVENT_BAR = "eBar."
 EVENT_LOG = "eLog"
@@ -2,11 +2,20 @@
 Basic data structure used for general trading function in the trading platform.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime as Datetime
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields
+from datetime import datetime as Datetime, tzinfo as TzInfo
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
 
 from .constant import Direction, Exchange, Interval, Offset, Status, Product, OptionType, OrderType
 
+if TYPE_CHECKING:
+    import polars as pl
+
 
 INFO: int = 20
 
@@ -14,6 +23,55 @@ INFO: int = 20
 ACTIVE_STATUSES = set([Status.SUBMITTING, Status.NOTTRADED, Status.PARTTRADED])
 
 
+# Max number of identifiers cached for each prefix
+VT_ID_CACHE_SIZE: int = 100_000
+
+# Cache of interned identifiers: prefix -> suffix -> identifier
+vt_id_cache: dict[str, dict[str, str]] = {}
+
+
+def get_vt_id(prefix: str, suffix: str) -> str:
+    """
+    Get interned identifier joined by prefix and suffix with a dot, e.g.
+    vt_symbol from symbol and exchange, vt_orderid from gateway_name
+    and orderid.
+
+    The same string object is returned for the same prefix and suffix,
+    so that strings are not created again for every data object, and
+    dict lookups by identifier are faster.
+    """
+    try:
+        return vt_id_cache[prefix][suffix]
+    except KeyError:
+        return add_vt_id(prefix, suffix)
+
+
+def add_vt_id(prefix: str, suffix: str) -> str:
+    """
+    Create identifier and add it into cache.
+    """
+    cache: dict[str, str] | None = vt_id_cache.get(prefix, None)
+    if cache is None:
+        cache = {}
+        vt_id_cache[prefix] = cache
+    elif len(cache) >= VT_ID_CACHE_SIZE:
+        cache.clear()
+
+    vt_id: str = sys.intern(f"{prefix}.{suffix}")
+    cache[suffix] = vt_id
+    return vt_id
+
+
+def get_vt_symbol(symbol: str, exchange: Exchange) -> str:
+    """
+    Get interned vt_symbol of symbol and exchange.
+    """
+    try:
+        return vt_id_cache[symbol][exchange._value_]
+    except KeyError:
+        return add_vt_id(symbol, exchange._value_)
+
+
 @dataclass
 class BaseData:
     """
@@ -81,7 +139,7 @@ class TickData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -105,7 +163,548 @@ class BarData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+
+
+@dataclass(slots=True)
+class SlotTickData:
+    """
+    Tick data with the same fields and behaviour as TickData, but
+    uses __slots__ instead of __dict__ to reduce memory footprint and
+    construction time, suitable for holding large amount of ticks
+    (e.g. replay or backtesting).
+    """
+
+    gateway_name: str
+
+    symbol: str
+    exchange: Exchange
+    datetime: Datetime
+
+    name: str = ""
+    volume: float = 0
+    turnover: float = 0
+    open_interest: float = 0
+    last_price: float = 0
+    last_volume: float = 0
+    limit_up: float = 0
+    limit_down: float = 0
+
+    open_price: float = 0
+    high_price: float = 0
+    low_price: float = 0
+    pre_close: float = 0
+
+    bid_price_1: float = 0
+    bid_price_2: float = 0
+    bid_price_3: float = 0
+    bid_price_4: float = 0
+    bid_price_5: float = 0
+
+    ask_price_1: float = 0
+    ask_price_2: float = 0
+    ask_price_3: float = 0
+    ask_price_4: float = 0
+    ask_price_5: float = 0
+
+    bid_volume_1: float = 0
+    bid_volume_2: float = 0
+    bid_volume_3: float = 0
+    bid_volume_4: float = 0
+    bid_volume_5: float = 0
+
+    ask_volume_1: float = 0
+    ask_volume_2: float = 0
+    ask_volume_3: float = 0
+    ask_volume_4: float = 0
+    ask_volume_5: float = 0
+
+    localtime: Datetime | None = None
+
+    extra: dict | None = field(default=None, init=False)
+    vt_symbol: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """"""
+        self.vt_symbol = get_vt_symbol(self.symbol, self.exchange)
+
+    @classmethod
+    def from_tick(cls, tick: TickData) -> "SlotTickData":
+        """
+        Create slot tick data from tick data.
+        """
+        data: dict = {name: getattr(tick, name) for name in TICK_FIELDS}
+        return cls(**data)
+
+    def to_tick(self) -> TickData:
+        """
+        Convert to tick data.
+        """
+        data: dict = {name: getattr(self, name) for name in TICK_FIELDS}
+        return TickData(**data)
+
+
+@dataclass(slots=True)
+class SlotBarData:
+    """
+    Bar data with the same fields and behaviour as BarData, but
+    uses __slots__ instead of __dict__ to reduce memory footprint and
+    construction time.
+    """
+
+    gateway_name: str
+
+    symbol: str
+    exchange: Exchange
+    datetime: Datetime
+
+    interval: Interval | None = None
+    volume: float = 0
+    turnover: float = 0
+    open_interest: float = 0
+    open_price: float = 0
+    high_price: float = 0
+    low_price: float = 0
+    close_price: float = 0
+
+    extra: dict | None = field(default=None, init=False)
+    vt_symbol: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """"""
+        self.vt_symbol = get_vt_symbol(self.symbol, self.exchange)
+
+    @classmethod
+    def from_bar(cls, bar: BarData) -> "SlotBarData":
+        """
+        Create slot bar data from bar data.
+        """
+        data: dict = {name: getattr(bar, name) for name in BAR_FIELDS}
+        return cls(**data)
+
+    def to_bar(self) -> BarData:
+        """
+        Convert to bar data.
+        """
+        data: dict = {name: getattr(self, name) for name in BAR_FIELDS}
+        return BarData(**data)
+
+
+# Init fields of tick and bar data
+TICK_FIELDS: list[str] = [f.name for f in fields(TickData) if f.init]
+BAR_FIELDS: list[str] = [f.name for f in fields(BarData) if f.init]
+
+# Float fields of tick and bar data, stored as columns in batch
+TICK_FLOAT_FIELDS: list[str] = [f.name for f in fields(TickData) if f.type is float]
+BAR_FLOAT_FIELDS: list[str] = [f.name for f in fields(BarData) if f.type is float]
+
+
+def to_datetime64(values: list[Datetime | None]) -> np.ndarray:
+    """
+    Convert datetimes into array of wall clock time, None into NaT.
+    """
+    data: list[Datetime | None] = [dt.replace(tzinfo=None) if dt else None for dt in values]
+    return np.array(data, dtype="datetime64[us]")
+
+
+def from_datetime64(array: np.ndarray, tz: TzInfo | None) -> list[Datetime | None]:
+    """
+    Convert array of wall clock time into datetimes, NaT into None.
+    """
+    data: list[Datetime | None] = array.astype("datetime64[us]").tolist()
+
+    if tz:
+        data = [dt.replace(tzinfo=tz) if dt else None for dt in data]
+
+    return data
+
+
+class BaseBatch(ABC):
+    """
+    Columnar container of data of the same contract, with each field
+    stored in a contiguous NumPy array.
+
+    Columns are exposed as array views by name, e.g. batch["close_price"],
+    and slicing a batch returns a new batch viewing the same arrays.
+    Data objects are only created when rows are accessed by index or
+    iteration, so bulk processing can skip creating Python objects.
+    """
+
+    float_fields: list[str] = []
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        datetime: np.ndarray,
+        columns: dict[str, np.ndarray],
+        gateway_name: str = "",
+        tz: TzInfo | None = None
+    ) -> None:
+        """
+        Column not provided is filled with zeros. Datetime column is
+        stored as wall clock time, and tz is attached to the datetime
+        of data objects created.
+        """
+        self.symbol: str = symbol
+        self.exchange: Exchange = exchange
+        self.vt_symbol: str = get_vt_symbol(symbol, exchange)
+        self.gateway_name: str = gateway_name
+        self.tz: TzInfo | None = tz
+
+        self.datetime: np.ndarray = np.asarray(datetime, dtype="datetime64[us]")
+
+        size: int = len(self.datetime)
+        self.columns: dict[str, np.ndarray] = {}
+
+        for name in self.float_fields:
+            column: np.ndarray | None = columns.get(name, None)
+
+            if column is None:
+                self.columns[name] = np.zeros(size)
+            else:
+                self.columns[name] = np.asarray(column, dtype=np.float64)
+
+    def __len__(self) -> int:
+        """"""
+        return len(self.datetime)
+
+    @overload
+    def __getitem__(self, key: str) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "BaseBatch": ...
+
+    @overload
+    def __getitem__(self, key: int) -> BaseData: ...
+
+    def __getitem__(self, key: int | slice | str) -> "np.ndarray | BaseBatch | BaseData":
+        """
+        Get column view by name, sub batch view by slice, or data
+        object by row index.
+        """
+        if isinstance(key, str):
+            if key == "datetime":
+                return self.datetime
+            return self.columns[key]
+        elif isinstance(key, slice):
+            return self.get_slice(key)
+        else:
+            return self.get_row(key)
+
+    def __iter__(self) -> Iterator[BaseData]:
+        """
+        Create data objects one by one while iterating.
+        """
+        for i in range(len(self)):
+            yield self.get_row(i)
+
+    @abstractmethod
+    def get_slice(self, key: slice) -> "BaseBatch":
+        """
+        Get sub batch viewing the same arrays.
+        """
+        pass
+
+    @abstractmethod
+    def get_row(self, index: int) -> BaseData:
+        """
+        Create data object of a row.
+        """
+        pass
+
+    def get_values(self, index: int) -> dict:
+        """
+        Get float values of a row.
+        """
+        return {name: column[index].item() for name, column in self.columns.items()}
+
+    def get_datetime(self, index: int) -> Datetime:
+        """
+        Get datetime of a row.
+        """
+        dt: Datetime = self.datetime[index].item()
+
+        if self.tz:
+            dt = dt.replace(tzinfo=self.tz)
+
+        return dt
+
+    def to_polars(self) -> "pl.DataFrame":
+        """
+        Convert to polars DataFrame with field names as column names,
+        NumPy arrays are used as buffers without copying where possible.
+        """
+        import polars as pl
+
+        series: list[pl.Series] = [pl.Series("datetime", self.datetime)]
+
+        for name, column in self.columns.items():
+            series.append(pl.Series(name, column))
+
+        return pl.DataFrame(series)
+
+
+class BarBatch(BaseBatch):
+    """
+    Columnar container of bars of the same contract and interval.
+    """
+
+    float_fields: list[str] = BAR_FLOAT_FIELDS
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval | None,
+        datetime: np.ndarray,
+        columns: dict[str, np.ndarray],
+        gateway_name: str = "",
+        tz: TzInfo | None = None
+    ) -> None:
+        """"""
+        super().__init__(symbol, exchange, datetime, columns, gateway_name, tz)
+
+        self.interval: Interval | None = interval
+
+    def get_slice(self, key: slice) -> "BarBatch":
+        """"""
+        columns: dict[str, np.ndarray] = {name: column[key] for name, column in self.columns.items()}
+
+        return BarBatch(
+            self.symbol, self.exchange, self.interval, self.datetime[key],
+            columns, self.gateway_name, self.tz
+        )
+
+    def get_row(self, index: int) -> BarData:
+        """"""
+        bar: BarData = BarData(
+            symbol=self.symbol,
+            exchange=self.exchange,
+            datetime=self.get_datetime(index),
+            interval=self.interval,
+            gateway_name=self.gateway_name,
+            **self.get_values(index)
+        )
+        return bar
+
+    def to_bars(self) -> list[BarData]:
+        """
+        Create bar data objects of all rows.
+        """
+        datetimes: list[Datetime | None] = from_datetime64(self.datetime, self.tz)
+        names: list[str] = list(self.columns.keys())
+        rows: zip = zip(*[c.tolist() for c in self.columns.values()], strict=True)
+
+        bars: list[BarData] = []
+
+        for dt, values in zip(datetimes, rows, strict=True):
+            bar: BarData = BarData(
+                symbol=self.symbol,
+                exchange=self.exchange,
+                datetime=dt,        # type: ignore
+                interval=self.interval,
+                gateway_name=self.gateway_name,
+                **dict(zip(names, values, strict=True))
+            )
+            bars.append(bar)
+
+        return bars
+
+    @classmethod
+    def from_bars(cls, bars: list[BarData]) -> "BarBatch":
+        """
+        Create batch from bars, contract and interval of the first bar
+        are used for the batch.
+        """
+        if not bars:
+            raise ValueError("bars must not be empty")
+
+        bar: BarData = bars[0]
+        count: int = len(bars)
+
+        columns: dict[str, np.ndarray] = {}
+        for name in BAR_FLOAT_FIELDS:
+            columns[name] = np.fromiter((getattr(b, name) for b in bars), dtype=np.float64, count=count)
+
+        return cls(
+            bar.symbol, bar.exchange, bar.interval, to_datetime64([b.datetime for b in bars]),
+            columns, bar.gateway_name, bar.datetime.tzinfo
+        )
+
+    @classmethod
+    def from_polars(
+        cls,
+        df: "pl.DataFrame",
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval | None = None,
+        gateway_name: str = "",
+        tz: TzInfo | None = None
+    ) -> "BarBatch":
+        """
+        Create batch from polars DataFrame with field names as column
+        names, columns are viewed without copying where possible.
+        """
+        columns: dict[str, np.ndarray] = {}
+        for name in BAR_FLOAT_FIELDS:
+            if name in df.columns:
+                columns[name] = df.get_column(name).to_numpy()
+
+        return cls(
+            symbol, exchange, interval, df.get_column("datetime").to_numpy(),
+            columns, gateway_name, tz
+        )
+
+
+class TickBatch(BaseBatch):
+    """
+    Columnar container of ticks of the same contract.
+    """
+
+    float_fields: list[str] = TICK_FLOAT_FIELDS
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        datetime: np.ndarray,
+        columns: dict[str, np.ndarray],
+        gateway_name: str = "",
+        tz: TzInfo | None = None,
+        name: str = "",
+        localtime: np.ndarray | None = None
+    ) -> None:
+        """
+        Localtime column is optional, with NaT for None value.
+        """
+        super().__init__(symbol, exchange, datetime, columns, gateway_name, tz)
+
+        self.name: str = name
+
+        if localtime is None:
+            self.localtime: np.ndarray = np.full(len(self.datetime), np.datetime64("NaT", "us"))
+        else:
+            self.localtime = np.asarray(localtime, dtype="datetime64[us]")
+
+    @overload
+    def __getitem__(self, key: str) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> BaseBatch: ...
+
+    @overload
+    def __getitem__(self, key: int) -> BaseData: ...
+
+    def __getitem__(self, key: int | slice | str) -> np.ndarray | BaseBatch | BaseData:
+        """"""
+        if key == "localtime":
+            return self.localtime
+        return super().__getitem__(key)
+
+    def get_slice(self, key: slice) -> "TickBatch":
+        """"""
+        columns: dict[str, np.ndarray] = {name: column[key] for name, column in self.columns.items()}
+
+        return TickBatch(
+            self.symbol, self.exchange, self.datetime[key], columns,
+            self.gateway_name, self.tz, self.name, self.localtime[key]
+        )
+
+    def get_row(self, index: int) -> TickData:
+        """"""
+        tick: TickData = TickData(
+            symbol=self.symbol,
+            exchange=self.exchange,
+            datetime=self.get_datetime(index),
+            name=self.name,
+            localtime=self.localtime[index].item(),
+            gateway_name=self.gateway_name,
+            **self.get_values(index)
+        )
+        return tick
+
+    def to_ticks(self) -> list[TickData]:
+        """
+        Create tick data objects of all rows.
+        """
+        datetimes: list[Datetime | None] = from_datetime64(self.datetime, self.tz)
+        localtimes: list[Datetime | None] = from_datetime64(self.localtime, None)
+        names: list[str] = list(self.columns.keys())
+        rows: zip = zip(*[c.tolist() for c in self.columns.values()], strict=True)
+
+        ticks: list[TickData] = []
+
+        for dt, localtime, values in zip(datetimes, localtimes, rows, strict=True):
+            tick: TickData = TickData(
+                symbol=self.symbol,
+                exchange=self.exchange,
+                datetime=dt,        # type: ignore
+                name=self.name,
+                localtime=localtime,
+                gateway_name=self.gateway_name,
+                **dict(zip(names, values, strict=True))
+            )
+            ticks.append(tick)
+
+        return ticks
+
+    def to_polars(self) -> "pl.DataFrame":
+        """"""
+        import polars as pl
+
+        df: pl.DataFrame = super().to_polars()
+        return df.with_columns(pl.Series("localtime", self.localtime))
+
+    @classmethod
+    def from_ticks(cls, ticks: list[TickData]) -> "TickBatch":
+        """
+        Create batch from ticks, contract of the first tick is used for
+        the batch.
+        """
+        if not ticks:
+            raise ValueError("ticks must not be empty")
+
+        tick: TickData = ticks[0]
+        count: int = len(ticks)
+
+        columns: dict[str, np.ndarray] = {}
+        for name in TICK_FLOAT_FIELDS:
+            columns[name] = np.fromiter((getattr(t, name) for t in ticks), dtype=np.float64, count=count)
+
+        return cls(
+            tick.symbol, tick.exchange, to_datetime64([t.datetime for t in ticks]),
+            columns, tick.gateway_name, tick.datetime.tzinfo, tick.name,
+            to_datetime64([t.localtime for t in ticks])
+        )
+
+    @classmethod
+    def from_polars(
+        cls,
+        df: "pl.DataFrame",
+        symbol: str,
+        exchange: Exchange,
+        gateway_name: str = "",
+        tz: TzInfo | None = None,
+        name: str = ""
+    ) -> "TickBatch":
+        """
+        Create batch from polars DataFrame with field names as column
+        names, columns are viewed without copying where possible.
+        """
+        columns: dict[str, np.ndarray] = {}
+        for field_name in TICK_FLOAT_FIELDS:
+            if field_name in df.columns:
+                columns[field_name] = df.get_column(field_name).to_numpy()
+
+        localtime: np.ndarray | None = None
+        if "localtime" in df.columns:
+            localtime = df.get_column("localtime").to_numpy()
+
+        return cls(
+            symbol, exchange, df.get_column("datetime").to_numpy(), columns,
+            gateway_name, tz, name, localtime
+        )
 
 
 @dataclass
@@ -131,8 +730,8 @@ class OrderData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_orderid: str = get_vt_id(self.gateway_name, self.orderid)
 
     def is_active(self) -> bool:
         """
@@ -170,9 +769,9 @@ class TradeData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
-        self.vt_tradeid: str = f"{self.gateway_name}.{self.tradeid}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_orderid: str = get_vt_id(self.gateway_name, self.orderid)
+        self.vt_tradeid: str = get_vt_id(self.gateway_name, self.tradeid)
 
 
 @dataclass
@@ -193,8 +792,8 @@ class PositionData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_positionid: str = f"{self.gateway_name}.{self.vt_symbol}.{self.direction.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_positionid: str = get_vt_id(self.gateway_name, get_vt_id(self.vt_symbol, self.direction._value_))
 
 
 @dataclass
@@ -212,7 +811,7 @@ class AccountData(BaseData):
     def __post_init__(self) -> None:
         """"""
         self.available: float = self.balance - self.frozen
-        self.vt_accountid: str = f"{self.gateway_name}.{self.accountid}"
+        self.vt_accountid: str = get_vt_id(self.gateway_name, self.accountid)
 
 
 @dataclass
@@ -258,7 +857,47 @@ class ContractData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+
+
+# Exchanges requiring close today and close yesterday orders separated
+CLOSE_YD_EXCHANGES: set[Exchange] = {Exchange.SHFE, Exchange.INE}
+
+
+@dataclass(slots=True)
+class ContractMeta:
+    """
+    Fields of contract data frequently used in order routing, with flags
+    precomputed for fast lookup.
+    """
+
+    vt_symbol: str
+    gateway_name: str
+    exchange: Exchange
+    size: float
+    pricetick: float
+    min_volume: float
+    net_position: bool
+    close_yd: bool              # whether close today and yesterday are separated
+    convert_required: bool      # whether offset convert is required
+
+    @classmethod
+    def from_contract(cls, contract: ContractData) -> "ContractMeta":
+        """
+        Create contract meta from contract data.
+        """
+        meta: ContractMeta = cls(
+            vt_symbol=contract.vt_symbol,
+            gateway_name=contract.gateway_name,
+            exchange=contract.exchange,
+            size=contract.size,
+            pricetick=contract.pricetick,
+            min_volume=contract.min_volume,
+            net_position=contract.net_position,
+            close_yd=contract.exchange in CLOSE_YD_EXCHANGES,
+            convert_required=not contract.net_position
+        )
+        return meta
 
 
 @dataclass
@@ -284,8 +923,8 @@ class QuoteData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_quoteid: str = f"{self.gateway_name}.{self.quoteid}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_quoteid: str = get_vt_id(self.gateway_name, self.quoteid)
 
     def is_active(self) -> bool:
         """
@@ -314,7 +953,7 @@ class SubscribeRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -334,7 +973,7 @@ class OrderRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_order_data(self, orderid: str, gateway_name: str) -> OrderData:
         """
@@ -367,7 +1006,7 @@ class CancelRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -384,7 +1023,7 @@ class HistoryRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -405,7 +1044,7 @@ class QuoteRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_quote_data(self, quoteid: str, gateway_name: str) -> QuoteData:
         """
@@ -24,6 +24,11 @@ SETTINGS: dict = {
     "email.sender": "",
     "email.receiver": "",
 
+    "oms.max_orders": 0,
+    "oms.max_trades": 0,
+    "oms.archive": "oms_archive.db",
+    "oms.verify_frozen": False,
+
     "datafeed.name": "",
     "datafeed.username": "",
     "datafeed.password": "",
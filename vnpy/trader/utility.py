@@ -14,7 +14,7 @@ import numpy as np
 import talib
 from zoneinfo import ZoneInfo, available_timezones      # noqa
 
-from .object import BarData, TickData
+from .object import BarData, TickData, get_vt_symbol
 from .constant import Exchange, Interval
 from .locale import _
 
@@ -31,7 +31,7 @@ def generate_vt_symbol(symbol: str, exchange: Exchange) -> str:
     """
     return vt_symbol
     """
-    return f"{symbol}.{exchange.value}"
+    return get_vt_symbol(symbol, exchange)
 
 
 def _get_trader_dir(temp_name: str) -> tuple[Path, Path]: